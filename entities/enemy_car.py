@@ -10,7 +10,8 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import pygame
 
-from game.utils import get_resource_path
+from managers.asset_manager import get_asset_manager
+from game.collision import collides, enemy_hitbox
 from game.config import (
     LANE_POSITIONS, ENEMY_CAR_WIDTH, ENEMY_CAR_HEIGHT,
     ENEMY_START_Y, BASE_ENEMY_SPEED, DIFFICULTY_MULTIPLIERS
@@ -19,7 +20,7 @@ from game.config import (
 
 class EnemyCar:
     
-    def __init__(self, difficulty=1, random_func=None):
+    def __init__(self, difficulty=1, random_func=None, assets=None):
         self.width = ENEMY_CAR_WIDTH
         self.height = ENEMY_CAR_HEIGHT
         
@@ -34,16 +35,35 @@ class EnemyCar:
         difficulty_multiplier = DIFFICULTY_MULTIPLIERS[difficulty]
         self.speed = int(BASE_ENEMY_SPEED * difficulty_multiplier)
         
-        # Load image
-        self.image = pygame.image.load(
-            get_resource_path(os.path.join("assets", "car_black.png"))
-        )
+        # Per-tick movement and near miss bookkeeping
+        self.step = 0
+        self.near_miss_counted = False
+        
+        # Shared image, fetched on first draw so headless runs skip it
+        self.assets = assets
+        self._image = None
+        self._hitbox = None
+    
+    @property
+    def image(self):
+        if self._image is None:
+            if not self.assets:
+                self.assets = get_asset_manager()
+            self._image = self.assets.get_image("car_black.png")
+        return self._image
     
+    @property
+    def hitbox(self):
+        if self._hitbox is None:
+            self._hitbox = enemy_hitbox(self.assets)
+        return self._hitbox
+
     def _default_choice(self, choices):
         import random
         return random.choice(choices)
     
     def update(self):
+        self.step = self.speed
         self.y += self.speed
     
     def draw(self, surface):
@@ -52,11 +72,13 @@ class EnemyCar:
     def is_off_screen(self, screen_height):
         return self.y > screen_height
     
-    def reset(self, random_func=None):
+    def reset(self, random_func=None, y=ENEMY_START_Y):
         if random_func:
             self._random_choice = random_func
         self.x = self._random_choice(LANE_POSITIONS)
-        self.y = ENEMY_START_Y
+        self.y = y
+        self.step = 0
+        self.near_miss_counted = False
     
     def set_speed(self, speed):
         self.speed = speed
@@ -67,13 +89,8 @@ class EnemyCar:
     def get_rect(self):
         return pygame.Rect(self.x, self.y, self.width, self.height)
     
-    def check_collision(self, player_x, player_y, player_width):
-        if (self.y + self.height > player_y and 
-            self.y < player_y + 100):  
-            if (self.x + self.width > player_x and 
-                self.x < player_x + player_width):
-                return True
-        return False
+    def check_collision(self, player_x, player_y, player_hitbox):
+        return collides(player_hitbox, player_x, player_y, self.hitbox, self.x, self.y)
     
     def check_near_miss(self, player_x, player_y, threshold_x=50, threshold_y=100):
         return (abs(player_x - self.x) <= threshold_x and 
@@ -11,7 +11,8 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import pygame
 
-from game.utils import get_resource_path
+from managers.asset_manager import get_asset_manager
+from game.collision import player_hitboxes
 from game.config import (
     AVAILABLE_CARS, CAR_WIDTH, CAR_START_X, 
     DISPLAY_HEIGHT, SPECIAL_CAR_FRAMES, SPECIAL_CAR_ANIMATION_SPEED
@@ -20,7 +21,8 @@ from game.config import (
 
 class PlayerCar:
     
-    def __init__(self, car_index=0):
+    def __init__(self, car_index=0, assets=None):
+        self.assets = assets if assets else get_asset_manager()
         self.car_index = car_index
         self.x = CAR_START_X
         self.y = int(DISPLAY_HEIGHT * 0.8)
@@ -34,6 +36,7 @@ class PlayerCar:
         
         # Load car image
         self.image = None
+        self.hitboxes = []
         self.load_car_image(car_index)
     
     def load_car_image(self, car_index):
@@ -44,27 +47,23 @@ class PlayerCar:
             self._load_special_car()
         else:
             self._load_standard_car(car_filename)
+        self.hitboxes = player_hitboxes(car_index, self.assets)
     
     def _load_special_car(self):
         try:
             self.spc_frames = []
             for i in range(SPECIAL_CAR_FRAMES):
-                frame_path = get_resource_path(os.path.join("assets", "spc", f"spc{i}.png"))
-                frame_img = pygame.image.load(frame_path)
+                frame_img = self.assets.get_image(os.path.join("spc", f"spc{i}.png"))
                 self.spc_frames.append(frame_img)
             self.image = self.spc_frames[0]
             self.current_frame = 0
         except pygame.error:
             print("Warning: Special car images not found. Using fallback.")
-            self.image = pygame.image.load(
-                get_resource_path(os.path.join("assets", "car_yellow.png"))
-            )
+            self.image = self.assets.get_image("car_yellow.png")
             self.spc_frames = []
     
     def _load_standard_car(self, filename):
-        self.image = pygame.image.load(
-            get_resource_path(os.path.join("assets", filename))
-        )
+        self.image = self.assets.get_image(filename)
         self.spc_frames = []
     
     def update_animation(self):
@@ -88,5 +87,9 @@ class PlayerCar:
         self.x = x
         self.y = y
     
+    @property
+    def hitbox(self):
+        return self.hitboxes[self.current_frame % len(self.hitboxes)]
+
     def get_rect(self):
         return pygame.Rect(self.x, self.y, self.width, self.image.get_height())
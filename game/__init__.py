@@ -6,3 +6,11 @@ SpeedyHighway v1.2.0
 from .config import *
 from .states import GameStates
 from .utils import get_resource_path
+
+
+def __getattr__(name):
+    # The simulation pulls in pygame and the entities, so it loads on first use
+    if name == "Simulation":
+        from .simulation import Simulation
+        return Simulation
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
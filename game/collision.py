@@ -0,0 +1,69 @@
+"""
+Collision Hitboxes
+SpeedyHighway v1.2.0
+
+Pixel masks of the car sprites, tested only once their opaque rects overlap.
+Moves are swept so fast cars cannot pass through the player between ticks.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from managers.asset_manager import get_asset_manager
+from game.config import AVAILABLE_CARS, SPECIAL_CAR_FRAMES
+
+ENEMY_SPRITE = "car_black.png"
+FALLBACK_SPRITE = "car_yellow.png"
+
+
+class Hitbox:
+    def __init__(self, mask):
+        self.mask = mask
+        # Opaque bounds relative to the sprite's top-left corner
+        rects = mask.get_bounding_rects() or [pygame.Rect(0, 0, 0, 0)]
+        rect = rects[0].unionall(rects[1:])
+        self.left, self.top, self.right, self.bottom = rect.left, rect.top, rect.right, rect.bottom
+
+
+def collides(a, ax, ay, b, bx, by):
+    if (ax + a.right <= bx + b.left or bx + b.right <= ax + a.left
+            or ay + a.bottom <= by + b.top or by + b.bottom <= ay + a.top):
+        return False
+    return a.mask.overlap(b.mask, (bx - ax, by - ay)) is not None
+
+
+def sweep(a, ax, ay, b, bx, by0, by1):
+    # Earliest fraction of b's move down from by0 to by1 at which it touches a, or None
+    if ax + a.right <= bx + b.left or bx + b.right <= ax + a.left:
+        return None
+    start = max(by0, ay + a.top - b.bottom + 1)
+    end = min(by1, ay + a.bottom - b.top - 1)
+    offset_x = bx - ax
+    for y in range(start, end + 1):
+        if a.mask.overlap(b.mask, (offset_x, y - ay)) is not None:
+            return (y - by0) / (by1 - by0) if by1 > by0 else 1.0
+    return None
+
+
+def sprite_hitbox(name, assets=None):
+    assets = assets if assets else get_asset_manager()
+    return Hitbox(assets.get_mask(name))
+
+
+def enemy_hitbox(assets=None):
+    return sprite_hitbox(ENEMY_SPRITE, assets)
+
+
+def player_hitboxes(car_index, assets=None):
+    # One hitbox per animation frame; the special car cycles through its frames
+    car_file = AVAILABLE_CARS[car_index]
+    if car_file == "special":
+        try:
+            return [sprite_hitbox(os.path.join("spc", f"spc{i}.png"), assets) for i in range(SPECIAL_CAR_FRAMES)]
+        except pygame.error:
+            return [sprite_hitbox(FALLBACK_SPRITE, assets)]
+    return [sprite_hitbox(car_file, assets)]
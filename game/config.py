@@ -11,6 +11,23 @@ __description__ = "Speedy Highway Racing Game - Enhanced Edition"
 DISPLAY_WIDTH = 800
 DISPLAY_HEIGHT = 600
 
+# Present only changed screen regions and skip unchanged static screens; gameplay
+# frames still present in full because the road scrolls every pixel
+DIRTY_RECT_RENDERING = False
+
+# Block on input instead of ticking at 60 FPS while the screen is static
+IDLE_WAIT = True
+IDLE_WAIT_MS = 1000
+FRAME_RATE = 60
+
+# Gameplay simulates at a fixed rate and renders up to RENDER_FRAME_RATE
+SIMULATION_RATE = 60
+MAX_SIMULATION_STEPS = 5
+RENDER_FRAME_RATE = 144
+
+# Replay playback speeds in ticks per simulation step, 0 runs uncapped
+REPLAY_SPEEDS = [1, 8, 0]
+
 BLACK = (15, 15, 25)          # deep night background
 WHITE = (230, 230, 250)       # soft lavender white
 GREEN = (0, 255, 180)         # neon teal (unlocked)
@@ -48,6 +65,18 @@ BASE_BG_SPEED = 3
 MAX_ENEMY_SPEEDS = [10, 15, 18, None] 
 MAX_BG_SPEEDS = [7, 12, 15, None]
 
+# Traffic density per difficulty as (tick, max concurrent enemy cars) steps
+TRAFFIC_DENSITY = [
+    [(0, 1)],
+    [(0, 1), (3600, 2)],
+    [(0, 1), (1800, 2), (5400, 3)],
+    [(0, 2), (1800, 3), (3600, 4)],
+]
+TRAFFIC_POOL_SIZE = 8
+TRAFFIC_SPAWN_SPACING = 220
+# "objects" runs EnemyCar instances, "numpy" the struct-of-arrays engine
+TRAFFIC_ENGINE = "objects"
+
 # Animation
 SPECIAL_CAR_FRAMES = 12
 SPECIAL_CAR_ANIMATION_SPEED = 15
@@ -78,17 +107,94 @@ MUSIC_FILES = {
     'game_music': 'game_music.mp3'
 }
 
-# Daily challenges
+# Decoded sounds are kept up to this size, least recently played dropped first
+SOUND_CACHE_BYTES = 4 * 1024 * 1024
+# Decode the sounds a run is likely to need on a background thread
+SOUND_PREFETCH = True
+# Keep decoded sound effects as raw mixer PCM under data/audio_cache
+AUDIO_CACHE = True
+
+# Mixer channels set aside for each group; a sound only ever plays on its own group's channels
+MIXER_CHANNEL_GROUPS = {
+    "engine": 2,
+    "alert": 2,
+    "jingle": 2,
+    "effect": 3,
+    "ui": 1
+}
+# Sound -> (group, priority, max voices); a full group gives up its oldest lowest-priority voice
+SOUND_VOICES = {
+    'crash': ("alert", 3, 1),
+    'off_road': ("alert", 2, 1),
+    'achievement': ("jingle", 2, 1),
+    'car_unlock': ("jingle", 3, 1),
+    'near_miss': ("effect", 1, 2),
+    'menu_select': ("ui", 1, 1),
+    'engine_default': ("engine", 2, 1),
+    'engine_blue': ("engine", 2, 1),
+    'engine_red': ("engine", 2, 1),
+    'engine_special': ("engine", 2, 1),
+    # Two voices so a speed band change can crossfade between loops
+    'engine_default_loop': ("engine", 3, 2),
+    'engine_blue_loop': ("engine", 3, 2),
+    'engine_red_loop': ("engine", 3, 2),
+    'engine_special_loop': ("engine", 3, 2)
+}
+DEFAULT_SOUND_VOICE = ("effect", 1, 1)
+# Engine loop pitch by speed as (lowest enemy_car_speed, playback rate), one buffer per band
+ENGINE_SPEED_BANDS = [(0, 0.9), (8, 1.0), (12, 1.12), (16, 1.25), (22, 1.4)]
+# Fixed allowance for the current car's pitch-shifted loops, on top of SOUND_CACHE_BYTES;
+# bands that do not fit reuse the nearest band that does
+ENGINE_BANK_BYTES = 6 * 1024 * 1024
+ENGINE_CROSSFADE_MS = 300
+# "auto" falls back to silent audio when no sound device opens, "mixer" requires one, "null" never opens it
+AUDIO_BACKEND = "auto"
+AUDIO_BACKENDS = ["auto", "mixer", "null"]
+NULL_AUDIO_LOG_SIZE = 1000
+
+# Achievements, car unlocks and daily challenges, all as metric thresholds.
+# A rule is met once its metric reaches target; a dict target maps
+# difficulty -> target and skips the other difficulties.
+PROGRESS_RULES = [
+    {"kind": "achievement", "id": "first_game", "name": "First Drive", "description": "Play your first game",
+     "metric": "games_played", "target": 1},
+    {"kind": "achievement", "id": "score_1000", "name": "Road Warrior", "description": "Score 1000 points",
+     "metric": "total_score", "target": 1000},
+    {"kind": "achievement", "id": "score_5000", "name": "Highway Legend", "description": "Score 5000 points",
+     "metric": "total_score", "target": 5000},
+    {"kind": "achievement", "id": "near_miss_10", "name": "Close Call", "description": "Get 10 near misses",
+     "metric": "near_miss_count", "target": 10},
+    {"kind": "achievement", "id": "lane_master", "name": "Lane Master", "description": "Change lanes 50 times",
+     "metric": "lane_change_count", "target": 50},
+    {"kind": "achievement", "id": "survivor", "name": "Survivor", "description": "Survive 2 minutes",
+     "metric": "survival_time", "target": 7200},
+    {"kind": "achievement", "id": "speed_demon", "name": "Speed Demon", "description": "Reach max speed",
+     "metric": "enemy_car_speed", "target": {2: 18, 3: 20}},
+    {"kind": "achievement", "id": "speed_god", "name": "Speed God", "description": "40 speed in Insane",
+     "metric": "enemy_car_speed", "target": {3: 40}},
+    {"kind": "achievement", "id": "perfect_game", "name": "Perfect Game", "description": "Complete daily challenge",
+     "metric": "daily_challenge_completed", "target": 1},
+] + [
+    {"kind": "car", "id": car, "metric": "total_score", "target": score}
+    for car, score in enumerate(CAR_UNLOCK_SCORES) if score
+] + [
+    {"kind": "daily", "type": "score", "metric": "total_score", "target": 2000, "description": "Score 2000 points"},
+    {"kind": "daily", "type": "survival", "metric": "survival_time", "target": 3600, "description": "Survive for 1 minute"},
+    {"kind": "daily", "type": "near_miss", "metric": "near_miss_count", "target": 15, "description": "Get 15 near misses"},
+    {"kind": "daily", "type": "lane_change", "metric": "lane_change_count", "target": 30, "description": "Change lanes 30 times"},
+]
+
+# Daily challenges as stored in the save file
 DAILY_CHALLENGES = [
-    {"type": "score", "target": 2000, "description": "Score 2000 points"},
-    {"type": "survival", "target": 3600, "description": "Survive for 1 minute"},
-    {"type": "near_miss", "target": 15, "description": "Get 15 near misses"},
-    {"type": "lane_change", "target": 30, "description": "Change lanes 30 times"}
+    {"type": rule["type"], "target": rule["target"], "description": rule["description"]}
+    for rule in PROGRESS_RULES if rule["kind"] == "daily"
 ]
 
+# Saves arriving within this window are written once, off the game thread
+SAVE_COALESCE_SECONDS = 0.25
+
 # Default game data structure
 DEFAULT_GAME_DATA = {
-    "high_scores": [],
     "difficulty": 1,
     "selected_car": 0,
     "unlocked_cars": [0],
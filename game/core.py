@@ -8,7 +8,6 @@ import sys
 import random
 import hashlib
 import time
-from datetime import datetime
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -16,30 +15,50 @@ import pygame
 
 from game.config import (
     __version__, DISPLAY_WIDTH, DISPLAY_HEIGHT, BLACK, WHITE, GREEN, RED, BLUE, YELLOW,
-    DIFFICULTY_MODES, DIFFICULTY_MULTIPLIERS, SCORE_MULTIPLIERS, LANE_POSITIONS,
-    ROAD_MIN_X, ROAD_MAX_X, AVAILABLE_CARS, CAR_WIDTH, CAR_START_X, ENEMY_CAR_WIDTH,
-    ENEMY_CAR_HEIGHT, ENEMY_START_Y, BASE_ENEMY_SPEED, BASE_BG_SPEED, MAX_ENEMY_SPEEDS,
-    MAX_BG_SPEEDS, SPECIAL_CAR_FRAMES, SPECIAL_CAR_ANIMATION_SPEED, KEY_REPEAT_DELAY,
-    DAILY_CHALLENGES
+    DIFFICULTY_MODES, AVAILABLE_CARS, SPECIAL_CAR_FRAMES, SPECIAL_CAR_ANIMATION_SPEED,
+    DIRTY_RECT_RENDERING, IDLE_WAIT, IDLE_WAIT_MS, FRAME_RATE,
+    SIMULATION_RATE, MAX_SIMULATION_STEPS, RENDER_FRAME_RATE, REPLAY_SPEEDS, AUDIO_BACKEND
 )
 from game.states import GameStates
-from game.utils import get_resource_path
-from managers.sound_manager import SoundManager
-from managers.data_manager import load_game_data, save_game_data, create_default_game_data
-from managers.achievement_manager import Achievement, generate_daily_challenge
+from game.renderer import DirtyRectRenderer
+from game.timestep import FixedTimestep
+from game.simulation import Simulation, INPUT_LEFT, INPUT_RIGHT, EVENT_NEAR_MISS, EVENT_CRASH
+from game.replay import Replay
+from managers.sound_manager import create_sound_manager
+from managers.asset_manager import get_asset_manager
+from managers.data_manager import load_game_data, SaveWriter, RunHistory, create_default_game_data, write_replay_bytes
+from managers.achievement_manager import RuleEngine, generate_daily_challenge
 from screens.menu import display_main_menu, display_seed_input, display_quit_confirmation
-from screens.game_screen import display_enhanced_hud, display_pause_menu, display_countdown_timer
-from screens.game_over import display_game_over_screen
-from screens.high_scores import display_high_scores
-from screens.achievements import display_achievements
-from screens.car_selection import display_car_selection
+# Only the menu draws the first frame; the other screens load through the package when first shown
+import screens
+
+
+def _sim_attribute(name):
+    return property(lambda self: getattr(self.sim, name))
 
 
 class CarRacing:
 
-    def __init__(self):
+    # Rule state lives in the Simulation; these keep the screens' names working
+    count = _sim_attribute("count")
+    survival_time = _sim_attribute("survival_time")
+    base_score = _sim_attribute("base_score")
+    bonus_score = _sim_attribute("bonus_score")
+    total_score = _sim_attribute("total_score")
+    near_miss_count = _sim_attribute("near_miss_count")
+    lane_change_count = _sim_attribute("lane_change_count")
+    car_x_coordinate = _sim_attribute("car_x")
+    car_y_coordinate = _sim_attribute("car_y")
+    enemy_car_speed = _sim_attribute("enemy_speed")
+    bg_speed = _sim_attribute("bg_speed")
+
+    def __init__(self, dirty_rects=DIRTY_RECT_RENDERING, idle_wait=IDLE_WAIT, audio=AUDIO_BACKEND, profile=None):
+        self.profile = profile
         pygame.init()
+        self._mark("pygame.init")
+        self.assets = get_asset_manager()
         self._set_icon()
+        self._mark("assets")
         
         # Display
         self.display_width, self.display_height = DISPLAY_WIDTH, DISPLAY_HEIGHT
@@ -47,15 +66,22 @@ class CarRacing:
         self.red, self.blue, self.yellow = RED, BLUE, YELLOW
         self.clock = pygame.time.Clock()
         self.gameDisplay = None
+        self.renderer = DirtyRectRenderer(dirty_rects)
+        self._input_generation = 0
+        self.idle_wait = idle_wait
+        self.timestep = FixedTimestep(SIMULATION_RATE, MAX_SIMULATION_STEPS)
+        self._drawn_enemies = set()
         
         # Entropy system
         self._entropy_seed = None
         self._game_random = random.Random()
-        self._replay_data = []
-        self._is_replay_mode = False
+        self.replay = None
+        self.replay_active = False
+        self.replay_speed = REPLAY_SPEEDS[0]
         
         # Managers
-        self.sound_manager = SoundManager()
+        self.sound_manager = create_sound_manager(audio)
+        self._mark("audio")
         
         # State
         self.current_state = GameStates.MENU
@@ -67,21 +93,33 @@ class CarRacing:
         
         # Load data and initialize
         self.game_data = load_game_data()
-        self._init_achievements()
+        self.game_data_version = 0
+        self.save_writer = SaveWriter()
+        # Replays are written off the game loop too, so the crash frame does not wait on the disk
+        self.replay_writer = SaveWriter(0, write_replay_bytes, Replay.to_bytes)
+        self.run_history = RunHistory(game_data=self.game_data)
+        self._init_progress()
         self.daily_challenge, _ = generate_daily_challenge(self.game_data)
-        save_game_data(self.game_data)
+        self._save_game_data()
+        self._mark("data")
         self.initialize()
+        self._mark("assets")
         self.sound_manager.play_music('menu_music')
+        self.sound_manager.prefetch(['menu_select'])
+        self.sound_manager.prefetch_for_car(self.current_car)
+        self._mark("audio")
+
+    def _mark(self, phase):
+        if self.profile:
+            self.profile.mark(phase)
 
     def _set_icon(self):
         try:
-            icon_path = os.path.join("assets", "ico.png")
-            if os.path.exists(icon_path):
-                pygame.display.set_icon(pygame.image.load(icon_path))
+            pygame.display.set_icon(self.assets.get_image("ico.png", alpha=False))
         except Exception:
             pass
 
-    def initialize(self, seed=None):
+    def initialize(self, seed=None, replay=None):
         self.crashed = self.paused = self.show_countdown = False
         self.unpause_timer = 0
         
@@ -91,18 +129,9 @@ class CarRacing:
         elif not self._entropy_seed:
             self._generate_seed()
         
-        # Scores
-        self.base_score = self.bonus_score = self.near_miss_count = 0
-        self.lane_change_count = self.survival_time = self.total_score = 0
-        self.enemy_car_near_miss_counted = False
         self.near_miss_flash_timer = 0
         self.engine_started = False
         
-        # Input
-        self.last_key_press_time = {"left": 0, "right": 0}
-        self.key_repeat_delay = KEY_REPEAT_DELAY
-        self.key_pressed_last_frame = {"left": False, "right": False}
-        
         # Settings from saved data
         self.difficulty_modes = DIFFICULTY_MODES
         self.current_difficulty = self.game_data.get("difficulty", 1)
@@ -115,55 +144,75 @@ class CarRacing:
         self.special_car_animation_timer = 0
         self.special_car_animation_speed = SPECIAL_CAR_ANIMATION_SPEED
         
+        # Rules, recorded so the run can be replayed
+        self.replay_active = replay is not None
+        if replay:
+            self.current_difficulty = replay.difficulty
+            self.current_car = replay.car
+            self.sim = replay.create_simulation()
+        else:
+            run_seed = self._game_random.getrandbits(32)
+            self.sim = Simulation(run_seed, self.current_difficulty, self.current_car)
+            self.replay = Replay(run_seed, self.current_difficulty, self.current_car)
+            self.progress.start(self.current_difficulty, self.game_data, self.daily_challenge)
+        
         # Load assets
         self._load_car()
         self._load_enemy()
         self._load_background()
-        self.count = 0
+        self.timestep.reset()
 
     def _load_car(self):
+        self._load_car_image()
+
+    def _load_car_image(self):
         car_file = self.available_cars[self.current_car]
         if car_file == "special":
             try:
                 self.carImg_spc_frames = [
-                    pygame.image.load(get_resource_path(os.path.join("assets", "spc", f"spc{i}.png")))
+                    self.assets.get_image(os.path.join("spc", f"spc{i}.png"))
                     for i in range(SPECIAL_CAR_FRAMES)
                 ]
-                self.carImg = self.carImg_spc_frames[0]
+                self.carImg = self.carImg_spc_frames[self.special_car_frame % SPECIAL_CAR_FRAMES]
             except pygame.error:
-                self.carImg = pygame.image.load(get_resource_path(os.path.join("assets", "car_yellow.png")))
+                self.carImg = self.assets.get_image("car_yellow.png")
         else:
-            self.carImg = pygame.image.load(get_resource_path(os.path.join("assets", car_file)))
-        self.car_x_coordinate = CAR_START_X
-        self.car_y_coordinate = int(self.display_height * 0.8)
-        self.car_width = CAR_WIDTH
+            self.carImg = self.assets.get_image(car_file)
 
     def _load_enemy(self):
-        self.enemy_car = pygame.image.load(get_resource_path(os.path.join("assets", "car_black.png")))
-        self.enemy_car_startx = self._choice(LANE_POSITIONS)
-        self.enemy_car_starty = ENEMY_START_Y
-        mult = DIFFICULTY_MULTIPLIERS[self.current_difficulty]
-        self.enemy_car_speed = int(BASE_ENEMY_SPEED * mult)
-        self.enemy_car_width, self.enemy_car_height = ENEMY_CAR_WIDTH, ENEMY_CAR_HEIGHT
+        self.enemy_car = self.assets.get_image("car_black.png")
 
     def _load_background(self):
-        self.bgImg = pygame.image.load(get_resource_path(os.path.join("assets", "back.jpg")))
-        self.bgImg = pygame.transform.scale(self.bgImg, (self.display_width, self.display_height))
+        self._load_background_images()
         self.bg_y1, self.bg_y2 = 0, -self.display_height
-        self.bg_speed = int(BASE_BG_SPEED * DIFFICULTY_MULTIPLIERS[self.current_difficulty])
-        
+        self._bg_step = 0
+
+    def _load_background_images(self):
+        self.bgImg = self.assets.get_scaled("back.jpg", (self.display_width, self.display_height), alpha=False)
         try:
-            icon = pygame.image.load(get_resource_path(os.path.join("assets", "ico.png")))
-            scale = max(self.display_width / icon.get_width(), self.display_height / icon.get_height())
-            self.menu_bg_icon = pygame.transform.scale(icon, (int(icon.get_width() * scale), int(icon.get_height() * scale)))
-            self.menu_bg_icon_faded = self.menu_bg_icon.copy()
-            overlay = pygame.Surface(self.menu_bg_icon.get_size())
-            overlay.set_alpha(180)
-            overlay.fill((0, 0, 0))
-            self.menu_bg_icon_faded.blit(overlay, (0, 0))
+            self.menu_bg_icon = self.assets.get_derived("menu_bg_icon", self._build_menu_icon)
+            self.menu_bg_icon_faded = self.assets.get_derived("menu_bg_icon_faded", self._build_menu_icon_faded)
         except Exception:
             self.menu_bg_icon = self.menu_bg_icon_faded = None
 
+    def _build_menu_icon(self, assets):
+        icon = assets.get_image("ico.png", alpha=False)
+        scale = max(self.display_width / icon.get_width(), self.display_height / icon.get_height())
+        return pygame.transform.scale(icon, (int(icon.get_width() * scale), int(icon.get_height() * scale)))
+
+    def _build_menu_icon_faded(self, assets):
+        faded = assets.get_derived("menu_bg_icon", self._build_menu_icon).copy()
+        overlay = pygame.Surface(faded.get_size())
+        overlay.set_alpha(180)
+        overlay.fill((0, 0, 0))
+        faded.blit(overlay, (0, 0))
+        return faded
+
+    def _refresh_images(self):
+        self._load_car_image()
+        self.enemy_car = self.assets.get_image("car_black.png")
+        self._load_background_images()
+
     def _generate_seed(self):
         ts = int(time.time() * 1000000)
         self._entropy_seed = int(hashlib.md5(f"{ts}{os.getpid()}{id(self)}".encode()).hexdigest()[:8], 16)
@@ -175,81 +224,46 @@ class CarRacing:
         self._game_random.seed(seed)
         print(f"Set entropy seed to: {seed}")
 
-    def _choice(self, choices):
-        if self._is_replay_mode and self._replay_data:
-            return self._replay_data.pop(0)
-        choice = self._game_random.choice(choices)
-        if not self._is_replay_mode:
-            self._replay_data.append(choice)
-        return choice
-
     def get_entropy_seed(self):
         return self._entropy_seed
 
-    def _init_achievements(self):
-        self.achievements = [
-            Achievement("first_game", "First Drive", "Play your first game", lambda: self.games_played >= 1),
-            Achievement("score_1000", "Road Warrior", "Score 1000 points", lambda: self.total_score >= 1000),
-            Achievement("score_5000", "Highway Legend", "Score 5000 points", lambda: self.total_score >= 5000),
-            Achievement("near_miss_10", "Close Call", "Get 10 near misses", lambda: self.near_miss_count >= 10),
-            Achievement("lane_master", "Lane Master", "Change lanes 50 times", lambda: self.lane_change_count >= 50),
-            Achievement("survivor", "Survivor", "Survive 2 minutes", lambda: self.survival_time >= 7200),
-            Achievement("speed_demon", "Speed Demon", "Reach max speed", lambda: self._check_speed_demon()),
-            Achievement("speed_god", "Speed God", "40 speed in Insane", lambda: self._check_speed_god()),
-            Achievement("perfect_game", "Perfect Game", "Complete daily challenge", lambda: self.daily_challenge.get("completed", False))
-        ]
-        for a in self.achievements:
-            a.unlocked = self.game_data.get("achievements", {}).get(a.id, False)
-
-    def _check_achievements(self):
-        changed = False
-        for a in self.achievements:
-            if not a.unlocked and a.condition():
-                a.unlocked = True
-                self.game_data["achievements"][a.id] = True
-                self.sound_manager.play_sound('achievement')
-                changed = True
-        if changed:
-            save_game_data(self.game_data)
-
-    def _check_speed_demon(self):
-        return self.current_difficulty >= 2 and self.enemy_car_speed >= (18 if self.current_difficulty == 2 else 20)
-
-    def _check_speed_god(self):
-        return self.current_difficulty == 3 and self.enemy_car_speed >= 40
-
-    def _calc_score(self):
-        self.base_score = self.count
-        bonus = self.near_miss_count * 10 + self.lane_change_count * 2 + (self.survival_time // 600) * 50
-        self.total_score = int((self.base_score + bonus) * SCORE_MULTIPLIERS[self.current_difficulty])
-
-    def _check_near_miss(self):
-        if abs(self.car_x_coordinate - self.enemy_car_startx) <= 50 and abs(self.car_y_coordinate - self.enemy_car_starty) <= 100:
-            if not self.enemy_car_near_miss_counted:
-                self.near_miss_count += 1
-                self.enemy_car_near_miss_counted = True
-                self.near_miss_flash_timer = 30
-                self.sound_manager.play_sound('near_miss')
-        elif self.enemy_car_starty > self.car_y_coordinate + 50:
-            self.enemy_car_near_miss_counted = False
-
-    def _check_car_unlocks(self):
-        unlocks = [(500, 1), (1500, 2), (3000, 3)]
-        for score, idx in unlocks:
-            if self.total_score >= score and idx not in self.game_data["unlocked_cars"]:
-                self.game_data["unlocked_cars"].append(idx)
-                save_game_data(self.game_data)
-                self.sound_manager.play_sound('car_unlock')
+    def _save_game_data(self):
+        # Screens cache their frames against this stamp
+        self.game_data_version += 1
+        self.save_writer.save(self.game_data)
+
+    def _init_progress(self):
+        self.progress = RuleEngine()
+        self.progress.load(self.game_data)
+        self.achievements = self.progress.achievements
+
+    @property
+    def daily_challenge_completed(self):
+        return int(self.daily_challenge.get("completed", False))
+
+    def _check_progress(self):
+        met = self.progress.check(self, self.game_data)
+        if met:
+            for rule in met:
+                if rule["kind"] == "achievement":
+                    self.sound_manager.play_sound('achievement')
+                elif rule["kind"] == "car":
+                    self.sound_manager.play_sound('car_unlock')
+            self._save_game_data()
 
     def racing_window(self):
         self._setup_display()
+        self._mark("display")
         self._game_loop()
 
     def _setup_display(self):
         flags = pygame.FULLSCREEN if self.fullscreen_mode else 0
         self.gameDisplay = pygame.display.set_mode((self.display_width, self.display_height), flags)
         pygame.display.set_caption(f'Speedy Highway v{__version__}')
+        self.assets.convert_for_display()
+        self._refresh_images()
         self._set_icon()
+        self.renderer.invalidate()
 
     def _toggle_fullscreen(self):
         self.fullscreen_mode = not self.fullscreen_mode
@@ -257,8 +271,13 @@ class CarRacing:
         self.sound_manager.play_sound('menu_select')
 
     def _game_loop(self):
+        idle = False
         while True:
-            for event in pygame.event.get():
+            self.sound_manager.new_frame()
+            events = self._wait_events() if idle else pygame.event.get()
+            for event in events:
+                if event.type != pygame.USEREVENT + 1:
+                    self._input_generation += 1
                 if event.type == pygame.QUIT:
                     self.quit_confirmation_active = True
                 elif event.type == pygame.USEREVENT + 1:
@@ -268,16 +287,62 @@ class CarRacing:
                 else:
                     self._handle_event(event)
             
+            state = self.current_state
+            # Keyed before the update, which draws the screen of the state it starts in;
+            # a state change made while updating shows up in the next frame's key
+            frame_key = self._frame_key()
             self._update_state()
-            pygame.display.update()
-            self.clock.tick(60)
+            self.renderer.present(frame_key)
+            if self.profile:
+                self._report_startup()
+            idle = self.idle_wait and state == self.current_state and self._idle_timeout() is not None
+            if not idle:
+                self.clock.tick(RENDER_FRAME_RATE if self.current_state == GameStates.PLAYING else FRAME_RATE)
+
+    def _idle_timeout(self):
+        # None while something animates, otherwise how long the loop may sleep
+        if self.current_state == GameStates.PLAYING and not self.paused:
+            return None
+        if self.current_state == GameStates.CAR_SELECTION and self.current_car == 3:
+            return None
+        if self.current_state == GameStates.MENU and self.seed_input_active:
+            return 500 - pygame.time.get_ticks() % 500
+        return IDLE_WAIT_MS
+
+    def _wait_events(self):
+        event = pygame.event.wait(self._idle_timeout())
+        events = [] if event.type == pygame.NOEVENT else [event]
+        events.extend(pygame.event.get())
+        # Restart the frame clock so the sleep is not counted as one long frame
+        self.clock.tick()
+        return events
+
+    def _frame_key(self):
+        # None means the frame animates; anything else identifies a static frame
+        if self.current_state == GameStates.PLAYING and not self.paused:
+            return None
+        cursor_phase = pygame.time.get_ticks() // 500 if self.seed_input_active else 0
+        car_frame = self.special_car_frame if self.current_state == GameStates.CAR_SELECTION else 0
+        return (self.current_state, self._input_generation, self.game_data_version, self.paused,
+                cursor_phase, car_frame)
+
+    def _report_startup(self):
+        self._mark("first present")
+        print(self.profile.report())
+        self._quit()
+
+    def _quit(self):
+        self.save_writer.close()
+        self.replay_writer.close()
+        self.run_history.close()
+        self.sound_manager.cleanup()
+        pygame.quit()
+        sys.exit()
 
     def _handle_quit_confirm(self, event):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_y:
-                self.sound_manager.cleanup()
-                pygame.quit()
-                sys.exit()
+                self._quit()
             elif event.key in (pygame.K_n, pygame.K_ESCAPE):
                 self.quit_confirmation_active = False
 
@@ -350,10 +415,16 @@ class CarRacing:
         self.sound_manager.play_music('game_music')
         self.engine_started = True
 
+    def _start_replay(self):
+        self.current_state = GameStates.PLAYING
+        self.initialize(replay=self.replay)
+        self.sound_manager.play_engine_sound(self.current_car)
+        self.engine_started = True
+
     def _cycle_difficulty(self):
         self.current_difficulty = (self.current_difficulty + 1) % len(DIFFICULTY_MODES)
         self.game_data["difficulty"] = self.current_difficulty
-        save_game_data(self.game_data)
+        self._save_game_data()
 
     def _update_menu(self):
         self.gameDisplay.fill(self.black)
@@ -375,73 +446,103 @@ class CarRacing:
                     self.paused = True
             elif event.key == pygame.K_f:
                 self._toggle_fullscreen()
+            elif self.replay_active and event.key in (pygame.K_1, pygame.K_2, pygame.K_3):
+                self.replay_speed = REPLAY_SPEEDS[event.key - pygame.K_1]
 
     def _update_game(self):
         if self.crashed:
             self._end_game()
             return
-        
+
+        if self.paused:
+            self.timestep.reset()
+            screens.display_pause_menu(self.gameDisplay)
+            return
+
+        alpha = 1.0
+        if self.replay_active and not self.replay_speed:
+            # Uncapped playback: simulate for one frame's worth of wall time
+            deadline = time.perf_counter() + self.timestep.step
+            while not self.crashed and time.perf_counter() < deadline:
+                self._simulate_tick()
+        else:
+            ticks = self.timestep.advance()
+            if self.replay_active:
+                ticks *= self.replay_speed
+            for _ in range(ticks):
+                self._simulate_tick()
+                if self.crashed:
+                    break
+            alpha = self.timestep.alpha
+        if self.sim.contact_time is not None:
+            # Show the crash at the moment of contact, not the end of the tick
+            alpha = self.sim.contact_time
+        if self.engine_started:
+            self.sound_manager.update_engine_speed(self.enemy_car_speed)
+
+        self._draw_game_frame(alpha)
+        if self.show_countdown:
+            screens.display_countdown_timer(self.gameDisplay, self.unpause_timer)
+
+    def _simulate_tick(self):
         if self.show_countdown:
+            self._scroll_background()
             self.unpause_timer -= 1
             if self.unpause_timer <= 0:
                 self.show_countdown = False
-
-        if self.paused:
-            display_pause_menu(self.gameDisplay)
-        elif self.show_countdown:
-            self._draw_game_frame()
-            display_countdown_timer(self.gameDisplay, self.unpause_timer)
         else:
             self._run_game_logic()
 
     def _run_game_logic(self):
-        self._draw_game_frame()
-        
-        # Move enemy
-        self.enemy_car_starty += self.enemy_car_speed
-        if self.enemy_car_starty > self.display_height:
-            self.enemy_car_starty = -self.enemy_car_height
-            self.enemy_car_startx = self._choice(LANE_POSITIONS)
-            self.enemy_car_near_miss_counted = False
-
-        # Update game state
-        self.count += 1
-        self.survival_time += 1
-        self._calc_score()
-        self._check_near_miss()
-        self._check_achievements()
-        self._check_car_unlocks()
-        self._handle_input()
-        self._update_special_car()
-        
-        if self.engine_started:
-            self.sound_manager.update_engine_volume(min(1.0, self.enemy_car_speed / 20.0))
-
-        # Increase difficulty
-        if self.count % 100 == 0:
-            max_speed = MAX_ENEMY_SPEEDS[self.current_difficulty]
-            if max_speed is None or self.enemy_car_speed < max_speed:
-                self.enemy_car_speed += 1
-            max_bg = MAX_BG_SPEEDS[self.current_difficulty]
-            if max_bg is None or self.bg_speed < max_bg:
-                self.bg_speed += 1
-
-        # Check collisions
-        if self.car_x_coordinate < ROAD_MIN_X or self.car_x_coordinate > ROAD_MAX_X:
-            self._crash('off_road')
-        elif self._check_collision():
-            self._crash('crash', 1.0)
-
-    def _draw_game_frame(self):
+        self._scroll_background()
+        if self.near_miss_flash_timer > 0:
+            self.near_miss_flash_timer -= 1
+
+        if self.replay_active:
+            inputs = self.replay.input_at(self.sim.count)
+        else:
+            inputs = self._read_input()
+            self.replay.record(inputs)
+
+        events = self.sim.step(inputs)
+        if EVENT_NEAR_MISS in events:
+            self.near_miss_flash_timer = 30
+            self.sound_manager.play_sound('near_miss')
+        if not self.replay_active:
+            self._check_progress()
+        self._sync_special_car()
+
+        if self.sim.crashed:
+            self._crash(self.sim.crash_reason, 1.0 if self.sim.crash_reason == EVENT_CRASH else None)
+        elif self.replay_active and self.sim.count >= len(self.replay):
+            self.crashed = True
+
+    def _draw_game_frame(self, alpha=1.0):
+        # alpha is how far the render sits between the previous tick and the current one
         self.gameDisplay.fill(self.black)
-        self._draw_background()
-        self.gameDisplay.blit(self.enemy_car, (self.enemy_car_startx, self.enemy_car_starty))
-        self.gameDisplay.blit(self.carImg, (self.car_x_coordinate, self.car_y_coordinate))
-        display_enhanced_hud(self.gameDisplay, self)
-
-    def _draw_background(self):
-        self.gameDisplay.blit(self.bgImg, (0, self.bg_y1))
-        self.gameDisplay.blit(self.bgImg, (0, self.bg_y2))
+        self._draw_background(alpha)
+        drawn = set()
+        for slot, x, y, step in self.sim.traffic.slots():
+            rect = self.gameDisplay.blit(self.enemy_car, (x, int(y - (1 - alpha) * step)))
+            self.renderer.track(("enemy", slot), rect)
+            drawn.add(slot)
+        for slot in self._drawn_enemies - drawn:
+            self.renderer.track(("enemy", slot), None)
+        self._drawn_enemies = drawn
+        car_rect = self.gameDisplay.blit(self.carImg, (self.car_x_coordinate, self.car_y_coordinate))
+        hud_rects = screens.display_enhanced_hud(self.gameDisplay, self)
+        self.renderer.track("player", car_rect)
+        for name, rect in hud_rects.items():
+            self.renderer.track(("hud", name), rect)
+
+    def _draw_background(self, alpha=1.0):
+        # The two tiles are always one screen apart, so wrap a single offset
+        offset = int(self.bg_y1 - (1 - alpha) * self._bg_step) % self.display_height
+        self.renderer.add(self.gameDisplay.blit(self.bgImg, (0, offset)))
+        self.renderer.add(self.gameDisplay.blit(self.bgImg, (0, offset - self.display_height)))
+
+    def _scroll_background(self):
+        self._bg_step = self.bg_speed
         self.bg_y1 += self.bg_speed
         self.bg_y2 += self.bg_speed
         if self.bg_y1 >= self.display_height:
@@ -449,46 +550,20 @@ class CarRacing:
         if self.bg_y2 >= self.display_height:
             self.bg_y2 = self.bg_y1 - self.display_height
 
-    def _check_collision(self):
-        if self.car_y_coordinate + 20 < self.enemy_car_starty + self.enemy_car_height and self.car_y_coordinate + 50 > self.enemy_car_starty:
-            car_left, car_right = self.car_x_coordinate + 10, self.car_x_coordinate + self.car_width - 10
-            enemy_left, enemy_right = self.enemy_car_startx + 10, self.enemy_car_startx + self.enemy_car_width - 10
-            return car_right > enemy_left and car_left < enemy_right
-        return False
-
     def _crash(self, sound, vol=None):
         self.sound_manager.play_sound(sound, volume_override=vol)
         self.sound_manager.stop_engine_sound()
         self.engine_started = False
         self.crashed = True
 
-    def _handle_input(self):
+    def _read_input(self):
         keys = pygame.key.get_pressed()
-        for direction, key_codes in [("left", [pygame.K_LEFT, pygame.K_a]), ("right", [pygame.K_RIGHT, pygame.K_d])]:
-            pressed = any(keys[k] for k in key_codes)
-            if pressed:
-                if not self.key_pressed_last_frame[direction] or self.count - self.last_key_press_time[direction] >= self.key_repeat_delay:
-                    self._move_left() if direction == "left" else self._move_right()
-                    self.last_key_press_time[direction] = self.count
-                self.key_pressed_last_frame[direction] = True
-            else:
-                self.key_pressed_last_frame[direction] = False
-
-    def _move_left(self):
-        moves = {295: 215, 415: 295, 495: 415, 215: 175}
-        new_x = moves.get(self.car_x_coordinate)
-        if new_x:
-            self.car_x_coordinate = new_x
-            if new_x in LANE_POSITIONS:
-                self.lane_change_count += 1
-
-    def _move_right(self):
-        moves = {215: 295, 295: 415, 415: 495, 495: 535}
-        new_x = moves.get(self.car_x_coordinate)
-        if new_x:
-            self.car_x_coordinate = new_x
-            if new_x in LANE_POSITIONS:
-                self.lane_change_count += 1
+        inputs = 0
+        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
+            inputs |= INPUT_LEFT
+        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+            inputs |= INPUT_RIGHT
+        return inputs
 
     def _update_special_car(self):
         if self.current_car == 3 and hasattr(self, 'carImg_spc_frames'):
@@ -498,46 +573,45 @@ class CarRacing:
                 self.special_car_frame = (self.special_car_frame + 1) % len(self.carImg_spc_frames)
                 self.carImg = self.carImg_spc_frames[self.special_car_frame]
 
+    def _sync_special_car(self):
+        # Draw the frame the simulation collides with
+        if self.current_car == 3 and hasattr(self, 'carImg_spc_frames'):
+            self.carImg = self.carImg_spc_frames[self.sim.car_frame % len(self.carImg_spc_frames)]
+
     def _end_game(self):
         self.sound_manager.stop_engine_sound()
         self.engine_started = False
+        if self.replay_active:
+            self.replay_active = False
+            self.current_state = GameStates.GAME_OVER
+            return
+        self.replay_writer.save(self.replay)
         self.games_played += 1
         self.game_data["games_played"] = self.games_played
         self.game_data["total_playtime"] = self.game_data.get("total_playtime", 0) + self.survival_time
         
-        # Update high scores
-        scores = self.game_data.get("high_scores", [])
-        scores.append({
-            "score": self.total_score,
-            "difficulty": DIFFICULTY_MODES[self.current_difficulty],
-            "survival_time": self.survival_time // 60,
-            "date": datetime.now().strftime("%Y-%m-%d %H:%M")
-        })
-        scores.sort(key=lambda x: x["score"], reverse=True)
-        self.game_data["high_scores"] = scores[:10]
+        self.run_history.record(self.total_score, self.current_difficulty, self.current_car, self.sim.seed,
+                                self.survival_time, self.near_miss_count, self.lane_change_count)
         
-        # Check daily challenge
-        if self.daily_challenge:
-            checks = {"score": self.total_score, "survival": self.survival_time, "near_miss": self.near_miss_count, "lane_change": self.lane_change_count}
-            target_type = self.daily_challenge.get("type")
-            if checks.get(target_type, 0) >= self.daily_challenge.get("target", 0):
-                self.daily_challenge["completed"] = True
-                self.game_data["daily_challenge"] = self.daily_challenge
-        
-        save_game_data(self.game_data)
+        # Games played counts towards progress too
+        self._check_progress()
+        self._save_game_data()
         self.current_state = GameStates.GAME_OVER
 
     def _update_pause(self):
-        display_pause_menu(self.gameDisplay)
+        screens.display_pause_menu(self.gameDisplay)
 
     def _update_game_over(self):
-        display_game_over_screen(self.gameDisplay, self)
-        if pygame.key.get_pressed()[pygame.K_SPACE]:
+        screens.display_game_over_screen(self.gameDisplay, self)
+        keys = pygame.key.get_pressed()
+        if keys[pygame.K_SPACE]:
             self.current_state = GameStates.MENU
             self.sound_manager.play_music('menu_music')
+        elif keys[pygame.K_r] and self.replay:
+            self._start_replay()
 
     def _update_high_scores(self):
-        display_high_scores(self.gameDisplay, self)
+        screens.display_high_scores(self.gameDisplay, self)
         if pygame.key.get_pressed()[pygame.K_ESCAPE]:
             self.current_state = GameStates.MENU
 
@@ -555,7 +629,7 @@ class CarRacing:
                 self.reset_confirmation_active = True
 
     def _update_achievements(self):
-        display_achievements(self.gameDisplay, self)
+        screens.display_achievements(self.gameDisplay, self)
 
     def _handle_car_select(self, event):
         if event.type == pygame.KEYDOWN:
@@ -585,21 +659,23 @@ class CarRacing:
 
     def _select_car(self):
         self.game_data["selected_car"] = self.current_car
-        save_game_data(self.game_data)
+        self._save_game_data()
         self.sound_manager.stop_engine_sound()
+        self.sound_manager.prefetch_for_car(self.current_car)
         self.current_state = GameStates.MENU
 
     def _update_car_selection(self):
         self._update_special_car()
-        display_car_selection(self.gameDisplay, self)
+        screens.display_car_selection(self.gameDisplay, self)
 
     def _reset_progress(self):
         self.game_data = create_default_game_data()
-        save_game_data(self.game_data)
+        self.run_history.clear()
+        self._save_game_data()
         self.current_difficulty = 1
         self.current_car = 0
         self.games_played = 0
-        self._init_achievements()
+        self._init_progress()
         self._load_car()
         self.daily_challenge, _ = generate_daily_challenge(self.game_data)
 
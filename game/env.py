@@ -0,0 +1,131 @@
+"""
+Driving Agent Environment
+SpeedyHighway v1.2.0
+
+Gym-style reset/step API over the headless simulation, single or batched.
+"""
+
+import os
+import sys
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from game.config import (
+    DISPLAY_HEIGHT, ENEMY_CAR_HEIGHT, LANE_POSITIONS, ROAD_MIN_X, ROAD_MAX_X, TRAFFIC_ENGINE
+)
+from game.simulation import Simulation, INPUT_LEFT, INPUT_RIGHT
+
+# Actions map to single input bits; left and right together would change lanes twice in one tick
+ACTION_NONE = 0
+ACTION_LEFT = 1
+ACTION_RIGHT = 2
+NUM_ACTIONS = 3
+ACTION_INPUTS = (0, INPUT_LEFT, INPUT_RIGHT)
+
+# Player x, enemy speed, then the gap to the nearest car ahead in each lane
+OBS_SIZE = 2 + len(LANE_POSITIONS)
+SPEED_SCALE = 20.0
+
+_LANE_INDEX = {x: i for i, x in enumerate(LANE_POSITIONS)}
+
+
+def action_input(action):
+    # Checked explicitly, since a negative action would otherwise index from the end
+    if not 0 <= action < NUM_ACTIONS:
+        raise IndexError(f"action {action} is outside 0..{NUM_ACTIONS - 1}")
+    return ACTION_INPUTS[action]
+
+def observe(sim, out):
+    out[0] = (sim.car_x - ROAD_MIN_X) / (ROAD_MAX_X - ROAD_MIN_X)
+    out[1] = sim.enemy_speed / SPEED_SCALE
+    gaps = [DISPLAY_HEIGHT] * len(LANE_POSITIONS)
+    front = sim.car_y
+    for _, x, y, _ in sim.traffic.slots():
+        if y < front + 50:
+            lane = _LANE_INDEX[x]
+            gap = front - y - ENEMY_CAR_HEIGHT
+            if gap < gaps[lane]:
+                gaps[lane] = gap
+    out[2:] = gaps
+    out[2:] /= DISPLAY_HEIGHT
+    return out
+
+
+class HighwayEnv:
+
+    def __init__(self, difficulty=1, max_ticks=None, engine=TRAFFIC_ENGINE, car=0):
+        if np is None:
+            raise ImportError("The agent environment requires numpy (pip install numpy)")
+        self.difficulty = difficulty
+        self.max_ticks = max_ticks
+        self.sim = Simulation(0, difficulty, car, engine=engine)
+        self._seeds = random.Random()
+        self._obs = np.zeros(OBS_SIZE, dtype=np.float32)
+
+    def reset(self, seed=None):
+        if seed is None:
+            seed = self._seeds.getrandbits(32)
+        self.sim.reset(seed)
+        return observe(self.sim, self._obs).copy()
+
+    def step(self, action):
+        sim = self.sim
+        score = sim.total_score
+        events = sim.step(action_input(action))
+        done = sim.crashed or (self.max_ticks is not None and sim.count >= self.max_ticks)
+        info = {"events": events, "score": sim.total_score, "ticks": sim.count, "crash_reason": sim.crash_reason}
+        return observe(sim, self._obs).copy(), float(sim.total_score - score), done, info
+
+
+class VectorHighwayEnv:
+    # Steps N games in lockstep; finished games reset themselves with the next seed
+
+    def __init__(self, num_envs, difficulty=1, max_ticks=None, engine=TRAFFIC_ENGINE, car=0):
+        if np is None:
+            raise ImportError("The agent environment requires numpy (pip install numpy)")
+        self.num_envs = num_envs
+        self.difficulty = difficulty
+        self.max_ticks = max_ticks
+        self.sims = [Simulation(0, difficulty, car, engine=engine) for _ in range(num_envs)]
+        self.obs = np.zeros((num_envs, OBS_SIZE), dtype=np.float32)
+        self.rewards = np.zeros(num_envs, dtype=np.float32)
+        self.dones = np.zeros(num_envs, dtype=bool)
+        self._seeds = random.Random()
+        self._next_seed = 0
+
+    def reset(self, seed=None):
+        if seed is None:
+            seed = self._seeds.getrandbits(32)
+        self._next_seed = seed
+        for sim, row in zip(self.sims, self.obs):
+            self._restart(sim, row)
+        return self.obs.copy()
+
+    def _restart(self, sim, row):
+        sim.reset(self._next_seed)
+        self._next_seed += 1
+        observe(sim, row)
+
+    def step(self, actions):
+        obs, rewards, dones = self.obs, self.rewards, self.dones
+        max_ticks = self.max_ticks
+        infos = [None] * self.num_envs
+        for i, sim in enumerate(self.sims):
+            score = sim.total_score
+            sim.step(action_input(actions[i]))
+            rewards[i] = sim.total_score - score
+            done = sim.crashed or (max_ticks is not None and sim.count >= max_ticks)
+            dones[i] = done
+            if done:
+                infos[i] = {"seed": sim.seed, "score": sim.total_score, "ticks": sim.count,
+                            "crash_reason": sim.crash_reason}
+                self._restart(sim, obs[i])
+            else:
+                observe(sim, obs[i])
+        return obs.copy(), rewards.copy(), dones.copy(), infos
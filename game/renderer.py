@@ -0,0 +1,84 @@
+"""
+Dirty Rectangle Renderer
+SpeedyHighway v1.2.0
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from game.config import DISPLAY_WIDTH, DISPLAY_HEIGHT
+
+# Past this share of the screen a single full present is cheaper than a rect list
+FULL_PRESENT_RATIO = 0.75
+
+
+class DirtyRectRenderer:
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.screen_rect = pygame.Rect(0, 0, DISPLAY_WIDTH, DISPLAY_HEIGHT)
+        self._dirty = []
+        self._tracked = {}
+        self._frame_key = None
+        self._full = True
+        self.stats = {"frames": 0, "full": 0, "partial": 0, "skipped": 0}
+
+    def invalidate(self):
+        self._full = True
+
+    def add(self, rect):
+        if rect:
+            self._dirty.append(pygame.Rect(rect))
+
+    def track(self, name, rect):
+        # Moving regions must also repaint where they were last frame
+        rect = pygame.Rect(rect) if rect else None
+        previous = self._tracked.get(name)
+        if previous:
+            self._dirty.append(previous)
+        if rect:
+            self._dirty.append(rect)
+            self._tracked[name] = rect
+        else:
+            self._tracked.pop(name, None)
+
+    def present(self, frame_key=None):
+        self.stats["frames"] += 1
+        if not self.enabled:
+            pygame.display.update()
+            self.stats["full"] += 1
+            self._reset()
+            return
+
+        if frame_key is not None:
+            # Static screen: only present when its inputs changed
+            if frame_key == self._frame_key and not self._full:
+                self.stats["skipped"] += 1
+                self._reset()
+                return
+            self._frame_key = frame_key
+            self._full = True
+        else:
+            self._frame_key = None
+
+        if self._full or self._dirty_area() >= self.screen_rect.w * self.screen_rect.h * FULL_PRESENT_RATIO:
+            pygame.display.update()
+            self.stats["full"] += 1
+        elif self._dirty:
+            pygame.display.update(self._dirty)
+            self.stats["partial"] += 1
+        else:
+            self.stats["skipped"] += 1
+        self._reset()
+
+    def _dirty_area(self):
+        clipped = [r.clip(self.screen_rect) for r in self._dirty]
+        return sum(r.w * r.h for r in clipped)
+
+    def _reset(self):
+        self._dirty = []
+        self._full = False
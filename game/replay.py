@@ -0,0 +1,96 @@
+"""
+Replay Recording And Playback
+SpeedyHighway v1.2.0
+
+Stores the run seed, difficulty, car and two bits of held keys per tick.
+"""
+
+import os
+import sys
+import struct
+import zlib
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game.simulation import Simulation
+
+REPLAY_MAGIC = b"SHRP"
+REPLAY_VERSION = 4
+
+# magic, version, seed, difficulty, car, ticks
+_HEADER = struct.Struct("<4sBQBBI")
+_BITS_PER_TICK = 2
+_TICKS_PER_BYTE = 8 // _BITS_PER_TICK
+_INPUT_MASK = (1 << _BITS_PER_TICK) - 1
+
+
+class ReplayError(ValueError):
+    pass
+
+
+class Replay:
+
+    def __init__(self, seed, difficulty, car=0, inputs=None, ticks=0):
+        self.seed = seed
+        self.difficulty = difficulty
+        self.car = car
+        self._inputs = bytearray(inputs or b"")
+        self.ticks = ticks
+
+    def __len__(self):
+        return self.ticks
+
+    def record(self, inputs):
+        index, shift = divmod(self.ticks, _TICKS_PER_BYTE)
+        if index == len(self._inputs):
+            self._inputs.append(0)
+        self._inputs[index] |= (inputs & _INPUT_MASK) << (shift * _BITS_PER_TICK)
+        self.ticks += 1
+
+    def input_at(self, tick):
+        if tick >= self.ticks:
+            return 0
+        index, shift = divmod(tick, _TICKS_PER_BYTE)
+        return (self._inputs[index] >> (shift * _BITS_PER_TICK)) & _INPUT_MASK
+
+    def create_simulation(self):
+        return Simulation(self.seed, self.difficulty, self.car)
+
+    def to_bytes(self):
+        header = _HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, self.seed, self.difficulty, self.car, self.ticks)
+        return header + zlib.compress(bytes(self._inputs), 9)
+
+    @classmethod
+    def from_bytes(cls, data):
+        if len(data) < _HEADER.size:
+            raise ReplayError("Replay data is truncated")
+        magic, version, seed, difficulty, car, ticks = _HEADER.unpack_from(data)
+        if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+            raise ReplayError("Not a SpeedyHighway replay")
+        try:
+            inputs = zlib.decompress(data[_HEADER.size:])
+        except zlib.error as e:
+            raise ReplayError(f"Corrupt replay inputs: {e}")
+        if len(inputs) * _TICKS_PER_BYTE < ticks:
+            raise ReplayError("Replay inputs are shorter than its tick count")
+        return cls(seed, difficulty, car, inputs, ticks)
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+
+def play_replay(replay, on_tick=None):
+    # Run a replay headlessly at full speed and return the final simulation
+    sim = replay.create_simulation()
+    while not sim.crashed and sim.count < replay.ticks:
+        events = sim.step(replay.input_at(sim.count))
+        if on_tick:
+            on_tick(sim, events)
+    return sim
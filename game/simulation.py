@@ -0,0 +1,165 @@
+"""
+Headless Simulation Core
+SpeedyHighway v1.2.0
+
+Game rules that run without a window or audio device.
+"""
+
+import os
+import sys
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game.config import (
+    DISPLAY_HEIGHT, DIFFICULTY_MULTIPLIERS, SCORE_MULTIPLIERS, LANE_POSITIONS,
+    ROAD_MIN_X, ROAD_MAX_X, CAR_WIDTH, CAR_START_X, BASE_ENEMY_SPEED, BASE_BG_SPEED,
+    MAX_ENEMY_SPEEDS, MAX_BG_SPEEDS, KEY_REPEAT_DELAY, TRAFFIC_ENGINE, SPECIAL_CAR_ANIMATION_SPEED
+)
+from game.traffic import TrafficManager
+from game.collision import player_hitboxes, enemy_hitbox
+
+# Per-tick input bits
+INPUT_LEFT = 1
+INPUT_RIGHT = 2
+
+# Event names, matching the sound each one plays
+EVENT_NEAR_MISS = "near_miss"
+EVENT_CRASH = "crash"
+EVENT_OFF_ROAD = "off_road"
+EVENT_LANE_CHANGE = "lane_change"
+EVENT_SPAWN = "spawn"
+EVENT_SPEED_UP = "speed_up"
+
+LEFT_MOVES = {295: 215, 415: 295, 495: 415, 215: 175}
+RIGHT_MOVES = {215: 295, 295: 415, 415: 495, 495: 535}
+
+
+class Simulation:
+
+    def __init__(self, seed=None, difficulty=1, car=0, choice=None, engine=TRAFFIC_ENGINE,
+                 assets=None, **traffic_options):
+        self.seed = seed
+        self.difficulty = difficulty
+        self.car = car
+        self.player_hitboxes = player_hitboxes(car, assets)
+        self.enemy_hitbox = enemy_hitbox(assets)
+        self.random = random.Random(seed)
+        self._choice = choice if choice else self.random.choice
+        if engine == "numpy":
+            from game.traffic_numpy import ArrayTraffic
+            self.traffic = ArrayTraffic(difficulty, self._choice, **traffic_options)
+        else:
+            self.traffic = TrafficManager(difficulty, self._choice, **traffic_options)
+        self.reset()
+
+    def reset(self, seed=None):
+        if seed is not None:
+            self.seed = seed
+            self.random.seed(seed)
+        mult = DIFFICULTY_MULTIPLIERS[self.difficulty]
+
+        self.count = self.survival_time = 0
+        self.base_score = self.bonus_score = self.total_score = 0
+        self.near_miss_count = self.lane_change_count = 0
+        self.crashed = False
+        self.crash_reason = None
+        self.contact_time = None
+
+        # Player
+        self.car_x = CAR_START_X
+        self.car_y = int(DISPLAY_HEIGHT * 0.8)
+        self.car_width = CAR_WIDTH
+
+        # Enemies
+        self.enemy_speed = int(BASE_ENEMY_SPEED * mult)
+        self.traffic.reset()
+
+        self.bg_speed = int(BASE_BG_SPEED * mult)
+
+        # Input
+        self.key_repeat_delay = KEY_REPEAT_DELAY
+        self.last_key_press_time = {"left": 0, "right": 0}
+        self.key_pressed_last_frame = {"left": False, "right": False}
+
+    def step(self, inputs=0):
+        events = []
+        if self.crashed:
+            return events
+
+        # Move enemies, recycling and spawning from the pool
+        events.extend([EVENT_SPAWN] * self.traffic.update(self.enemy_speed, self.count))
+
+        self.count += 1
+        self.survival_time += 1
+        self.calc_score()
+        events.extend([EVENT_NEAR_MISS] * self.check_near_miss())
+        self._apply_input(inputs, events)
+
+        # Increase difficulty
+        if self.count % 100 == 0:
+            max_speed = MAX_ENEMY_SPEEDS[self.difficulty]
+            if max_speed is None or self.enemy_speed < max_speed:
+                self.enemy_speed += 1
+                events.append(EVENT_SPEED_UP)
+            max_bg = MAX_BG_SPEEDS[self.difficulty]
+            if max_bg is None or self.bg_speed < max_bg:
+                self.bg_speed += 1
+
+        if self.car_x < ROAD_MIN_X or self.car_x > ROAD_MAX_X:
+            self._crash(EVENT_OFF_ROAD, events)
+        elif self.check_collision():
+            self._crash(EVENT_CRASH, events)
+        return events
+
+    def calc_score(self):
+        self.base_score = self.count
+        bonus = self.near_miss_count * 10 + self.lane_change_count * 2 + (self.survival_time // 600) * 50
+        self.total_score = int((self.base_score + bonus) * SCORE_MULTIPLIERS[self.difficulty])
+
+    def check_near_miss(self):
+        misses = self.traffic.check_near_miss(self.car_x, self.car_y)
+        self.near_miss_count += misses
+        return misses
+
+    @property
+    def car_frame(self):
+        # The special car animates one frame every few ticks
+        return (self.count // SPECIAL_CAR_ANIMATION_SPEED) % len(self.player_hitboxes)
+
+    def check_collision(self):
+        # contact_time is how far through the tick the first car touched
+        hitbox = self.player_hitboxes[self.car_frame]
+        self.contact_time = self.traffic.check_collision(self.car_x, self.car_y, hitbox, self.enemy_hitbox)
+        return self.contact_time is not None
+
+    def move_left(self):
+        return self._move(LEFT_MOVES)
+
+    def move_right(self):
+        return self._move(RIGHT_MOVES)
+
+    def _move(self, moves):
+        new_x = moves.get(self.car_x)
+        if new_x:
+            self.car_x = new_x
+            if new_x in LANE_POSITIONS:
+                self.lane_change_count += 1
+                return True
+        return False
+
+    def _apply_input(self, inputs, events):
+        for direction, bit, move in (("left", INPUT_LEFT, self.move_left), ("right", INPUT_RIGHT, self.move_right)):
+            if inputs & bit:
+                if not self.key_pressed_last_frame[direction] or self.count - self.last_key_press_time[direction] >= self.key_repeat_delay:
+                    if move():
+                        events.append(EVENT_LANE_CHANGE)
+                    self.last_key_press_time[direction] = self.count
+                self.key_pressed_last_frame[direction] = True
+            else:
+                self.key_pressed_last_frame[direction] = False
+
+    def _crash(self, reason, events):
+        self.crashed = True
+        self.crash_reason = reason
+        events.append(reason)
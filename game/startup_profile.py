@@ -0,0 +1,31 @@
+"""
+Startup Profile
+SpeedyHighway v1.2.0
+"""
+
+import time
+
+
+class StartupProfile:
+
+    def __init__(self, start=None):
+        self.start = start if start is not None else time.perf_counter()
+        self._last = self.start
+        self.phases = {}
+
+    def mark(self, phase):
+        # Charges the time since the previous mark to this phase
+        now = time.perf_counter()
+        self.phases[phase] = self.phases.get(phase, 0.0) + now - self._last
+        self._last = now
+
+    def total(self):
+        return self._last - self.start
+
+    def report(self):
+        total = self.total() or 1e-9
+        lines = ["Startup profile:"]
+        for phase, seconds in self.phases.items():
+            lines.append(f"  {phase:<14} {seconds * 1000:8.1f} ms  {seconds / total:6.1%}")
+        lines.append(f"  {'total':<14} {self.total() * 1000:8.1f} ms")
+        return "\n".join(lines)
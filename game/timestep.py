@@ -0,0 +1,36 @@
+"""
+Fixed Timestep
+SpeedyHighway v1.2.0
+"""
+
+import time
+
+
+class FixedTimestep:
+
+    def __init__(self, rate, max_steps):
+        self.step = 1.0 / rate
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self._last_time = None
+
+    def reset(self):
+        self.accumulator = 0.0
+        self._last_time = None
+
+    def advance(self):
+        now = time.perf_counter()
+        if self._last_time is None:
+            elapsed = self.step
+        else:
+            # Clamp long stalls so a hitch cannot trigger a burst of catch-up ticks
+            elapsed = min(now - self._last_time, self.step * self.max_steps)
+        self._last_time = now
+        self.accumulator += elapsed
+        steps = int(self.accumulator / self.step)
+        self.accumulator -= steps * self.step
+        return steps
+
+    @property
+    def alpha(self):
+        return self.accumulator / self.step
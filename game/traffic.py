@@ -0,0 +1,144 @@
+"""
+Traffic Manager
+SpeedyHighway v1.2.0
+
+Runs the enemy cars from a fixed pool, bucketed by lane for collision checks.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game.config import (
+    DISPLAY_HEIGHT, LANE_POSITIONS, ENEMY_CAR_HEIGHT, ENEMY_START_Y,
+    TRAFFIC_DENSITY, TRAFFIC_POOL_SIZE, TRAFFIC_SPAWN_SPACING
+)
+from entities.enemy_car import EnemyCar
+from game.collision import sweep
+
+NEAR_MISS_X = 50
+NEAR_MISS_Y = 100
+
+
+def _pool_lane(choices):
+    # Pooled cars get their real lane when spawned
+    return choices[0]
+
+
+def traffic_density(difficulty, tick):
+    target = 1
+    for start, cars in TRAFFIC_DENSITY[difficulty]:
+        if tick < start:
+            break
+        target = cars
+    return target
+
+
+class TrafficManager:
+
+    def __init__(self, difficulty, choice, pool_size=TRAFFIC_POOL_SIZE,
+                 spawn_spacing=TRAFFIC_SPAWN_SPACING, density=None):
+        self.difficulty = difficulty
+        self._choice = choice
+        self.spawn_spacing = spawn_spacing
+        self.density = density if density else lambda tick: traffic_density(difficulty, tick)
+        self.pool = [EnemyCar(difficulty, _pool_lane) for _ in range(pool_size)]
+        self._slot = {car: i for i, car in enumerate(self.pool)}
+        self.active = []
+        self.lanes = {x: [] for x in LANE_POSITIONS}
+        self._free = []
+        self._last_spawned = None
+        self._collision_lanes = {}
+
+    def reset(self):
+        self.clear()
+        self.spawn(ENEMY_START_Y)
+
+    def clear(self):
+        self.active = []
+        for bucket in self.lanes.values():
+            bucket.clear()
+        self._free = list(reversed(self.pool))
+        self._last_spawned = None
+
+    def update(self, speed, tick):
+        # Cars that left the screen last tick go back to the pool now, so a
+        # move that ends off screen is still swept for collisions
+        spawned = 0
+        for car in [c for c in self.active if c.y > DISPLAY_HEIGHT]:
+            self._release(car)
+
+        for car in self.active:
+            car.speed = speed
+            car.update()
+
+        target = min(self.density(tick), len(self.pool))
+        while len(self.active) < target and self._can_spawn():
+            self.spawn(-ENEMY_CAR_HEIGHT)
+            spawned += 1
+        return spawned
+
+    def _can_spawn(self):
+        # One car per row keeps a lane open; rows are at least the spacing apart
+        last = self._last_spawned
+        return last is None or last not in self.active or last.y + ENEMY_CAR_HEIGHT >= self.spawn_spacing
+
+    def spawn(self, y):
+        car = self._free.pop()
+        car.reset(self._choice, y)
+        self.active.append(car)
+        self.lanes[car.x].append(car)
+        self._last_spawned = car
+        return car
+
+    def slots(self):
+        return [(self._slot[car], car.x, car.y, car.step) for car in self.active]
+
+    def _release(self, car):
+        self.active.remove(car)
+        self.lanes[car.x].remove(car)
+        self._free.append(car)
+
+    def check_collision(self, car_x, car_y, player, enemy):
+        # Earliest contact time within this tick's moves, or None
+        # Buckets are ordered oldest first, so y falls along each list
+        contact = None
+        for lane in self._lanes_for(self._collision_lanes, car_x, player, enemy):
+            for car in self.lanes[lane]:
+                if car.y - car.step + enemy.top >= car_y + player.bottom:
+                    continue
+                if car.y + enemy.bottom <= car_y + player.top:
+                    break
+                t = sweep(player, car_x, car_y, enemy, car.x, car.y - car.step, car.y)
+                if t is not None and (contact is None or t < contact):
+                    contact = t
+        return contact
+
+    def check_near_miss(self, car_x, car_y):
+        misses = 0
+        for lane, bucket in self.lanes.items():
+            in_reach = abs(car_x - lane) <= NEAR_MISS_X
+            for enemy in bucket:
+                # Sweep the tick's move so fast cars cannot skip the window
+                if enemy.y - enemy.step > car_y + NEAR_MISS_Y:
+                    continue
+                if enemy.y < car_y - NEAR_MISS_Y:
+                    break
+                if in_reach:
+                    if not enemy.near_miss_counted:
+                        enemy.near_miss_counted = True
+                        misses += 1
+                elif enemy.y > car_y + 50:
+                    enemy.near_miss_counted = False
+        return misses
+
+    def _lanes_for(self, cache, car_x, player, enemy):
+        # The player only ever sits at a handful of x positions
+        key = (car_x, player.left, player.right, enemy.left, enemy.right)
+        lanes = cache.get(key)
+        if lanes is None:
+            lanes = [x for x in LANE_POSITIONS
+                     if car_x + player.right > x + enemy.left and x + enemy.right > car_x + player.left]
+            cache[key] = lanes
+        return lanes
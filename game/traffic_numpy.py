@@ -0,0 +1,127 @@
+"""
+NumPy Traffic Engine
+SpeedyHighway v1.2.0
+
+Struct-of-arrays version of TrafficManager for stress runs and balancing sweeps.
+Gives the same results as the per-object engine, tick for tick.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from game.config import (
+    DISPLAY_HEIGHT, ENEMY_CAR_HEIGHT, ENEMY_START_Y,
+    LANE_POSITIONS, TRAFFIC_POOL_SIZE, TRAFFIC_SPAWN_SPACING
+)
+from game.traffic import NEAR_MISS_X, NEAR_MISS_Y, traffic_density
+from game.collision import sweep
+
+
+class ArrayTraffic:
+
+    def __init__(self, difficulty, choice, pool_size=TRAFFIC_POOL_SIZE,
+                 spawn_spacing=TRAFFIC_SPAWN_SPACING, density=None):
+        if np is None:
+            raise ImportError("The NumPy traffic engine requires numpy (pip install numpy)")
+        self.difficulty = difficulty
+        self._choice = choice
+        self.spawn_spacing = spawn_spacing
+        self.density = density if density else lambda tick: traffic_density(difficulty, tick)
+        self.pool_size = pool_size
+
+        self.x = np.zeros(pool_size, dtype=np.int64)
+        self.y = np.zeros(pool_size, dtype=np.int64)
+        self.step = np.zeros(pool_size, dtype=np.int64)
+        self.active = np.zeros(pool_size, dtype=bool)
+        self.near_miss_counted = np.zeros(pool_size, dtype=bool)
+        self.active_count = 0
+        self._free = []
+        self._last_spawned = None
+
+    def reset(self):
+        self.clear()
+        self.spawn(ENEMY_START_Y)
+
+    def clear(self):
+        self.active[:] = False
+        self.active_count = 0
+        self._free = list(range(self.pool_size - 1, -1, -1))
+        self._last_spawned = None
+
+    def update(self, speed, tick):
+        active = self.active
+        gone = active & (self.y > DISPLAY_HEIGHT)
+        if gone.any():
+            released = np.flatnonzero(gone)
+            active[released] = False
+            self.active_count -= len(released)
+            self._free.extend(released.tolist())
+
+        self.step[active] = speed
+        self.y[active] += speed
+
+        spawned = 0
+        target = min(self.density(tick), self.pool_size)
+        while self.active_count < target and self._can_spawn():
+            self.spawn(-ENEMY_CAR_HEIGHT)
+            spawned += 1
+        return spawned
+
+    def _can_spawn(self):
+        last = self._last_spawned
+        return (last is None or not self.active[last]
+                or self.y[last] + ENEMY_CAR_HEIGHT >= self.spawn_spacing)
+
+    def spawn(self, y):
+        slot = self._free.pop()
+        self.x[slot] = self._choice(LANE_POSITIONS)
+        self.y[slot] = y
+        self.step[slot] = 0
+        self.near_miss_counted[slot] = False
+        self.active[slot] = True
+        self.active_count += 1
+        self._last_spawned = slot
+        return slot
+
+    def slots(self):
+        index = np.flatnonzero(self.active)
+        return list(zip(index.tolist(), self.x[index].tolist(), self.y[index].tolist(), self.step[index].tolist()))
+
+    def check_collision(self, car_x, car_y, player, enemy):
+        x, y, start = self.x, self.y, self.y - self.step
+        # Rows of each move where the opaque bounds overlap, as sweep() would clamp them
+        first = np.maximum(start, car_y + player.top - enemy.bottom + 1)
+        last = np.minimum(y, car_y + player.bottom - enemy.top - 1)
+        near = np.flatnonzero(self.active & (first <= last)
+                              & (x + enemy.left < car_x + player.right) & (x + enemy.right > car_x + player.left))
+        if not len(near):
+            return None
+
+        # A car cannot touch before its first overlapping row, so sweep in that order
+        # and stop once no remaining car could beat the earliest contact found
+        travel = y[near] - start[near]
+        bounds = np.where(travel > 0, (first[near] - start[near]) / np.maximum(travel, 1), 1.0)
+        earliest = None
+        for k in np.argsort(bounds, kind="stable"):
+            if earliest is not None and bounds[k] >= earliest:
+                break
+            i = near[k]
+            t = sweep(player, car_x, car_y, enemy, int(x[i]), int(start[i]), int(y[i]))
+            if t is not None and (earliest is None or t < earliest):
+                earliest = t
+        return earliest
+
+    def check_near_miss(self, car_x, car_y):
+        window = self.active & (self.y - self.step <= car_y + NEAR_MISS_Y) & (self.y >= car_y - NEAR_MISS_Y)
+        reach = window & (np.abs(car_x - self.x) <= NEAR_MISS_X)
+        misses = int(np.count_nonzero(reach & ~self.near_miss_counted))
+        self.near_miss_counted |= reach
+        self.near_miss_counted &= ~(window & ~reach & (self.y > car_y + 50))
+        return misses
@@ -5,16 +5,35 @@ v1.2.0
 """
 
 import os
+import time
+import argparse
 import warnings
 
+# Taken before the game modules load so --profile-startup can time the imports
+STARTED = time.perf_counter()
+
 # Remove pygame support message
 os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
 warnings.filterwarnings('ignore')
 
 from game.core import CarRacing
+from game.config import AUDIO_BACKEND, AUDIO_BACKENDS
+from game.startup_profile import StartupProfile
 
 def main():
-    game = CarRacing()
+    parser = argparse.ArgumentParser(description="SpeedyHighway")
+    parser.add_argument("--audio", choices=AUDIO_BACKENDS, default=AUDIO_BACKEND,
+                        help="sound backend; null runs silently without a sound device")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="print the time spent in each startup phase up to the first frame, then exit")
+    args = parser.parse_args()
+
+    profile = None
+    if args.profile_startup:
+        profile = StartupProfile(STARTED)
+        profile.mark("imports")
+
+    game = CarRacing(audio=args.audio, profile=profile)
     game.racing_window()
 
 if __name__ == "__main__":
@@ -2,6 +2,36 @@
 Managers module for SpeedyHighway
 """
 
-from .sound_manager import SoundManager
-from .data_manager import load_game_data, save_game_data, create_default_game_data, ensure_game_data_exists
-from .achievement_manager import Achievement, create_achievements, load_achievement_states, check_achievements, generate_daily_challenge
\ No newline at end of file
+import importlib
+
+_EXPORTS = {
+    "SoundManager": "sound_manager",
+    "create_sound_manager": "sound_manager",
+    "NullSoundManager": "null_audio",
+    "load_game_data": "data_manager",
+    "save_game_data": "data_manager",
+    "create_default_game_data": "data_manager",
+    "ensure_game_data_exists": "data_manager",
+    "get_replay_path": "data_manager",
+    "SaveWriter": "data_manager",
+    "RunHistory": "data_manager",
+    "AssetManager": "asset_manager",
+    "get_asset_manager": "asset_manager",
+    "AudioCache": "audio_cache",
+    "ChannelPool": "channel_pool",
+    "Achievement": "achievement_manager",
+    "RuleEngine": "achievement_manager",
+    "generate_daily_challenge": "achievement_manager"
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    # Resolve an export on first use and keep it, so the package import stays cheap
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
@@ -2,7 +2,7 @@
 Achievement Manager Module
 SpeedyHighway v1.2.0
 
-Handles achievements
+Handles achievements, car unlocks and daily challenges from one rule table
 """
 
 import os
@@ -13,63 +13,102 @@ from datetime import datetime
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from game.config import DAILY_CHALLENGES
+from game.config import DAILY_CHALLENGES, PROGRESS_RULES
 
 
 class Achievement:
-    def __init__(self, id, name, description, condition):
+    def __init__(self, id, name, description, metric, target):
         self.id = id
         self.name = name
         self.description = description
-        self.condition = condition
+        self.metric = metric
+        self.target = target
         self.unlocked = False
 
 
-def create_achievements(game_instance):
-    return [
-        Achievement("first_game", "First Drive", "Play your first game", 
-                   lambda: game_instance.games_played >= 1),
-        Achievement("score_1000", "Road Warrior", "Score 1000 points", 
-                   lambda: game_instance.total_score >= 1000),
-        Achievement("score_5000", "Highway Legend", "Score 5000 points", 
-                   lambda: game_instance.total_score >= 5000 and game_instance.current_difficulty >= 1),
-        Achievement("near_miss_10", "Close Call", "Get 10 near misses in one game", 
-                   lambda: game_instance.near_miss_count >= 10),
-        Achievement("lane_master", "Lane Master", "Change lanes 50 times in one game", 
-                   lambda: game_instance.lane_change_count >= 50),
-        Achievement("survivor", "Survivor", "Survive for 2 minutes", 
-                   lambda: game_instance.survival_time >= 7200),
-        Achievement("speed_demon", "Speed Demon", "Reach maximum speed", 
-                   lambda: game_instance.check_speed_demon_achievement()),
-        Achievement("speed_god", "Speed God", "Reach 40 speed in Insane difficulty", 
-                   lambda: game_instance.check_speed_god_achievement()),
-        Achievement("perfect_game", "Perfect Game", "Complete daily challenge", 
-                   lambda: game_instance.daily_challenge.get("completed", False))
-    ]
-
-
-def load_achievement_states(achievements, game_data):
-    for achievement in achievements:
-        achievement.unlocked = game_data.get("achievements", {}).get(achievement.id, False)
-
-
-def check_achievements(achievements, game_data, sound_manager):
-    achievements_changed = False
-    
-    for achievement in achievements:
-        if not achievement.unlocked and achievement.condition():
+def rule_target(rule, difficulty):
+    target = rule["target"]
+    return target.get(difficulty) if isinstance(target, dict) else target
+
+
+class RuleEngine:
+    # Each metric only watches its lowest unmet target, so a tick where
+    # nothing crosses costs one comparison per metric however many rules exist
+
+    def __init__(self, rules=PROGRESS_RULES):
+        self.rules = rules
+        self.achievements = [Achievement(r["id"], r["name"], r["description"], r["metric"], r["target"])
+                             for r in rules if r["kind"] == "achievement"]
+        self._achievements = {a.id: a for a in self.achievements}
+        self._daily_rules = {r["type"]: r for r in rules if r["kind"] == "daily"}
+        self._pending = {}
+        self._next = {}
+
+    def load(self, game_data):
+        for achievement in self.achievements:
+            achievement.unlocked = game_data.get("achievements", {}).get(achievement.id, False)
+
+    def start(self, difficulty, game_data, daily_challenge=None):
+        # Index the unmet rules by metric, lowest target at the end of each list
+        pending = {}
+        for order, rule in enumerate(self.rules):
+            if rule["kind"] == "daily" or self._is_met(rule, game_data):
+                continue
+            target = rule_target(rule, difficulty)
+            if target is not None:
+                pending.setdefault(rule["metric"], []).append((target, order, rule))
+        daily = self._daily_rules.get(daily_challenge.get("type")) if daily_challenge else None
+        if daily and not daily_challenge.get("completed", False):
+            pending.setdefault(daily["metric"], []).append((daily_challenge.get("target", 0), -1, daily))
+        for queue in pending.values():
+            queue.sort(reverse=True)
+        self._pending = pending
+        self._next = {metric: queue[-1][0] for metric, queue in pending.items()}
+
+    def check(self, source, game_data):
+        crossed = [metric for metric, target in self._next.items() if getattr(source, metric) >= target]
+        if not crossed:
+            return ()
+        met = []
+        for metric in crossed:
+            value = getattr(source, metric)
+            queue = self._pending[metric]
+            while queue and queue[-1][0] <= value:
+                rule = queue.pop()[2]
+                self._apply(rule, game_data)
+                met.append(rule)
+            if queue:
+                self._next[metric] = queue[-1][0]
+            else:
+                del self._next[metric]
+                del self._pending[metric]
+        return met
+
+    def _is_met(self, rule, game_data):
+        if rule["kind"] == "achievement":
+            return game_data.get("achievements", {}).get(rule["id"], False)
+        if rule["kind"] == "car":
+            return rule["id"] in game_data.get("unlocked_cars", [])
+        return False
+
+    def _apply(self, rule, game_data):
+        kind = rule["kind"]
+        if kind == "achievement":
+            achievement = self._achievements[rule["id"]]
             achievement.unlocked = True
-            game_data["achievements"][achievement.id] = True
+            game_data.setdefault("achievements", {})[rule["id"]] = True
             print(f"Achievement Unlocked: {achievement.name} - {achievement.description}")
-            sound_manager.play_sound('achievement')
-            achievements_changed = True
-    
-    return achievements_changed
+        elif kind == "car":
+            game_data.setdefault("unlocked_cars", [0]).append(rule["id"])
+        elif kind == "daily":
+            challenge = game_data.get("daily_challenge", {})
+            challenge["completed"] = True
+            game_data["daily_challenge"] = challenge
 
 
 def generate_daily_challenge(game_data):
     today = datetime.now().strftime("%Y-%m-%d")
-    
+
     if game_data.get("last_daily_challenge") != today:
         challenge_seed = int(hashlib.md5(today.encode()).hexdigest()[:8], 16)
         challenge_random = random.Random(challenge_seed)
@@ -77,5 +116,5 @@ def generate_daily_challenge(game_data):
         challenge["completed"] = False
         game_data["last_daily_challenge"] = today
         game_data["daily_challenge"] = challenge
-        return challenge, True  
+        return challenge, True
     return game_data.get("daily_challenge", {}), False
@@ -0,0 +1,91 @@
+"""
+Asset Manager Module
+SpeedyHighway v1.2.0
+
+Loads every image once and hands out display-ready shared surfaces and their collision masks
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from game.utils import get_resource_path
+
+
+class AssetManager:
+    def __init__(self):
+        self._files = {}
+        self._sources = {}
+        self._images = {}
+        self._masks = {}
+        self.disk_loads = 0
+
+    def get_image(self, name, alpha=True):
+        # Keyed with alpha, since the same file can be wanted both converted and with per-pixel alpha
+        key = (name, alpha)
+        image = self._images.get(key)
+        if image is None:
+            image = self._store(key, self._load(name), alpha)
+        return image
+
+    def get_scaled(self, name, size, alpha=True):
+        key = (name, tuple(size), alpha)
+        image = self._images.get(key)
+        if image is None:
+            source = pygame.transform.scale(self._load(name), size)
+            image = self._store(key, source, alpha)
+        return image
+
+    def get_derived(self, key, factory, alpha=False):
+        image = self._images.get(key)
+        if image is None:
+            image = self._store(key, factory(self), alpha)
+        return image
+
+    def get_mask(self, name):
+        # Built from the decoded file, so converting for the display keeps it valid
+        mask = self._masks.get(name)
+        if mask is None:
+            mask = pygame.mask.from_surface(self._load(name))
+            self._masks[name] = mask
+        return mask
+
+    def has_image(self, key):
+        return key in self._images
+
+    def convert_for_display(self):
+        for key, (source, alpha) in self._sources.items():
+            self._images[key] = self._prepare(source, alpha)
+
+    def _load(self, name):
+        # Each file is decoded once, whatever forms of it are handed out
+        source = self._files.get(name)
+        if source is None:
+            source = pygame.image.load(get_resource_path(os.path.join("assets", name)))
+            self.disk_loads += 1
+            self._files[name] = source
+        return source
+
+    def _store(self, key, source, alpha):
+        self._sources[key] = (source, alpha)
+        image = self._prepare(source, alpha)
+        self._images[key] = image
+        return image
+
+    def _prepare(self, source, alpha):
+        if pygame.display.get_surface() is None:
+            return source
+        return source.convert_alpha() if alpha else source.convert()
+
+
+_shared_assets = None
+
+
+def get_asset_manager():
+    global _shared_assets
+    if _shared_assets is None:
+        _shared_assets = AssetManager()
+    return _shared_assets
@@ -0,0 +1,96 @@
+"""
+Audio Cache Module
+SpeedyHighway v1.2.0
+
+Keeps sound effects decoded to mixer-native PCM on disk so later launches skip decoding
+"""
+
+import os
+import sys
+import mmap
+import hashlib
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from game.utils import get_resource_path
+
+
+def get_audio_cache_dir():
+    return get_resource_path(os.path.join("data", "audio_cache"))
+
+
+class AudioCache:
+    def __init__(self, directory=None):
+        self.directory = directory if directory else get_audio_cache_dir()
+        self.hits = 0
+        self.misses = 0
+        self._writable = True
+
+    def cache_path(self, sound_path):
+        # Keyed by the source bytes and the mixer format the PCM was converted to
+        digest = hashlib.sha1()
+        with open(sound_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        digest.update(repr(pygame.mixer.get_init()).encode())
+        name = os.path.splitext(os.path.basename(sound_path))[0]
+        return os.path.join(self.directory, f"{name}-{digest.hexdigest()[:16]}.pcm")
+
+    def load(self, sound_path):
+        cache_path = self.cache_path(sound_path)
+        sound = self._read(cache_path)
+        if sound is not None:
+            self.hits += 1
+            return sound
+        self.misses += 1
+        sound = pygame.mixer.Sound(sound_path)
+        self._write(cache_path, sound)
+        return sound
+
+    def _read(self, cache_path):
+        try:
+            with open(cache_path, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return None
+                # Map the file so the PCM goes straight into the mixer without an extra copy
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as pcm:
+                    return pygame.mixer.Sound(buffer=pcm)
+        except (OSError, ValueError, pygame.error):
+            return None
+
+    def _write(self, cache_path, sound):
+        if not self._writable:
+            return
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(temp_path, "wb") as f:
+                f.write(sound.get_raw())
+            os.replace(temp_path, cache_path)
+            self._remove_stale(cache_path)
+        except OSError as e:
+            print(f"Warning: Could not write audio cache, sounds will be decoded each launch: {e}")
+            self._writable = False
+
+    def _remove_stale(self, cache_path):
+        # Older conversions of the same file, from a changed source or mixer format
+        current = os.path.basename(cache_path)
+        prefix = current.rsplit("-", 1)[0] + "-"
+        for name in os.listdir(self.directory):
+            if name != current and name.startswith(prefix) and name.endswith(".pcm"):
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    pass
+
+    def clear(self):
+        if not os.path.isdir(self.directory):
+            return
+        for name in os.listdir(self.directory):
+            if name.endswith(".pcm"):
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    pass
@@ -0,0 +1,92 @@
+"""
+Channel Pool Module
+SpeedyHighway v1.2.0
+
+Reserves mixer channels per sound group and decides which voice gives way when a group is full
+"""
+
+import os
+import sys
+import itertools
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from game.config import MIXER_CHANNEL_GROUPS, SOUND_VOICES, DEFAULT_SOUND_VOICE
+
+
+class ChannelPool:
+    def __init__(self, groups=MIXER_CHANNEL_GROUPS, voices=SOUND_VOICES, default_voice=DEFAULT_SOUND_VOICE):
+        self.voices = voices
+        self.default_voice = default_voice
+        total = sum(groups.values())
+        pygame.mixer.set_num_channels(total)
+        # Reserve every channel so Sound.play() never picks one behind our back
+        pygame.mixer.set_reserved(total)
+        self.groups = {}
+        first = 0
+        for name, count in groups.items():
+            self.groups[name] = [pygame.mixer.Channel(i) for i in range(first, first + count)]
+            first += count
+        self._playing = {}
+        self._serial = itertools.count()
+        self._started_this_frame = set()
+        self.plays = 0
+        self.steals = 0
+        self.drops = 0
+
+    def new_frame(self):
+        self._started_this_frame.clear()
+
+    def can_start(self, sound_name):
+        # Each sound starts at most once per frame, so a burst of events costs one play
+        return sound_name not in self._started_this_frame
+
+    def play(self, sound_name, sound, loops=0, fade_ms=0):
+        group, priority, limit = self.voices.get(sound_name, self.default_voice)
+        channel = self._pick(self.groups[group], sound_name, priority, limit)
+        if channel is None:
+            self.drops += 1
+            return None
+        channel.play(sound, loops, fade_ms=fade_ms)
+        self._playing[channel] = (sound_name, priority, next(self._serial))
+        self._started_this_frame.add(sound_name)
+        self.plays += 1
+        return channel
+
+    def _pick(self, channels, sound_name, priority, limit):
+        free = None
+        own = []
+        candidates = []
+        for channel in channels:
+            voice = self._playing.get(channel)
+            if voice is None or not channel.get_busy():
+                if free is None:
+                    free = channel
+                continue
+            if voice[0] == sound_name:
+                own.append((voice[2], channel))
+            if voice[1] <= priority:
+                candidates.append((voice[1], voice[2], channel))
+
+        # Over its polyphony limit a sound replaces its own oldest voice
+        if len(own) >= limit:
+            self.steals += 1
+            return min(own, key=lambda v: v[0])[1]
+        if free is not None:
+            return free
+        # Otherwise steal the oldest of the lowest-priority voices it outranks or ties
+        if candidates:
+            self.steals += 1
+            return min(candidates, key=lambda v: (v[0], v[1]))[2]
+        return None
+
+    def stop(self, channel):
+        if channel:
+            channel.stop()
+            self._playing.pop(channel, None)
+
+    def stats(self):
+        busy = {name: sum(c.get_busy() for c in channels) for name, channels in self.groups.items()}
+        return {"busy": busy, "plays": self.plays, "steals": self.steals, "drops": self.drops}
@@ -6,9 +6,14 @@ SpeedyHighway v1.2.0
 import os
 import sys
 import json
+import time
+import atexit
+import sqlite3
+import threading
+from datetime import date, datetime, timedelta
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from game.utils import get_resource_path
-from game.config import DEFAULT_GAME_DATA
+from game.config import DEFAULT_GAME_DATA, SAVE_COALESCE_SECONDS, DIFFICULTY_MODES
 
 
 def load_game_data():
@@ -24,27 +29,313 @@ def create_default_game_data():
     return DEFAULT_GAME_DATA.copy()
 
 
-def save_game_data(game_data):
+def encode_game_data(game_data):
     if game_data is None:
         game_data = create_default_game_data()
-    
+    return json.dumps(game_data, indent=2)
+
+
+def save_game_data(game_data):
+    write_game_data_text(encode_game_data(game_data))
+
+
+def write_game_data_text(text):
     try:
         data_path = get_resource_path(os.path.join("data", "game_data.json"))
         os.makedirs(os.path.dirname(data_path), exist_ok=True)
-        with open(data_path, "w") as f:
-            json.dump(game_data, f, indent=2)
+        _write_atomic(data_path, text)
     except (OSError, PermissionError):
         try:
             if hasattr(sys, '_MEIPASS'):
                 data_path = os.path.join(os.path.dirname(sys.executable), "game_data.json")
             else:
                 data_path = os.path.join(os.getcwd(), "game_data.json")
-            with open(data_path, "w") as f:
-                json.dump(game_data, f, indent=2)
+            _write_atomic(data_path, text)
         except Exception as e:
             print(f"Warning: Could not save game data: {e}")
 
 
+def write_replay_bytes(data):
+    try:
+        replay_path = get_replay_path()
+        os.makedirs(os.path.dirname(replay_path), exist_ok=True)
+        _write_atomic(replay_path, data, "wb")
+    except OSError as e:
+        print(f"Warning: Could not save replay: {e}")
+
+
+def _write_atomic(path, text, mode="w"):
+    # A crash mid-write leaves the old file in place rather than a truncated one
+    temp_path = path + ".tmp"
+    with open(temp_path, mode) as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+class SaveWriter:
+    # Writes saves on a background thread; saves that arrive while one is
+    # waiting or being written collapse into a single write of the latest data
+
+    def __init__(self, delay=SAVE_COALESCE_SECONDS, write=write_game_data_text, encode=encode_game_data):
+        self.delay = delay
+        self._write = write
+        self._encode = encode
+        self._cond = threading.Condition()
+        self._pending = None
+        self._writing = False
+        self._flushing = False
+        self._closed = False
+        self.requests = 0
+        self.writes = 0
+        self._thread = threading.Thread(target=self._run, name="save-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def save(self, game_data):
+        # Snapshot on the caller's thread so later changes cannot race the write
+        text = self._encode(game_data)
+        with self._cond:
+            if self._closed:
+                self._write(text)
+                return
+            self._pending = text
+            self.requests += 1
+            self._cond.notify_all()
+
+    def flush(self):
+        with self._cond:
+            self._flushing = True
+            self._cond.notify_all()
+            while self._pending is not None or self._writing:
+                self._cond.wait()
+            self._flushing = False
+
+    def close(self):
+        if self._closed:
+            return
+        self.flush()
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._pending is None and not self._closed:
+                    self._cond.wait()
+                if self._pending is None:
+                    return
+                deadline = time.monotonic() + self.delay
+                while not (self._flushing or self._closed):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                text, self._pending = self._pending, None
+                self._writing = True
+            try:
+                self._write(text)
+            finally:
+                with self._cond:
+                    self._writing = False
+                    self.writes += 1
+                    self._cond.notify_all()
+
+
+def get_run_history_path():
+    return get_resource_path(os.path.join("data", "run_history.db"))
+
+
+RUN_HISTORY_VERSION = 2
+
+_RUN_HISTORY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    played_at TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    difficulty INTEGER NOT NULL,
+    car INTEGER,
+    seed INTEGER,
+    survival_ticks INTEGER NOT NULL,
+    near_misses INTEGER,
+    lane_changes INTEGER
+);
+CREATE INDEX IF NOT EXISTS runs_by_score ON runs (score DESC);
+CREATE INDEX IF NOT EXISTS runs_by_difficulty ON runs (difficulty, score DESC);
+CREATE INDEX IF NOT EXISTS runs_by_car ON runs (car, score DESC);
+CREATE INDEX IF NOT EXISTS runs_by_date ON runs (played_at, score);
+CREATE INDEX IF NOT EXISTS runs_by_difficulty_date ON runs (difficulty, played_at, score);
+CREATE INDEX IF NOT EXISTS runs_by_car_date ON runs (car, played_at, score);
+CREATE TABLE IF NOT EXISTS run_days (
+    day TEXT NOT NULL,
+    difficulty INTEGER NOT NULL,
+    car INTEGER NOT NULL,
+    best INTEGER NOT NULL,
+    runs INTEGER NOT NULL,
+    PRIMARY KEY (day, difficulty, car)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS run_days_by_best ON run_days (best);
+"""
+
+_RUN_COLUMNS = ("id", "played_at", "score", "difficulty", "car", "seed",
+                "survival_ticks", "near_misses", "lane_changes")
+
+
+class RunHistory:
+    # Every finished run, kept in SQLite so leaderboards are index lookups.
+    # run_days keeps each day's best score and run count per difficulty and car, which bounds
+    # date-range leaderboards so they walk a score index instead of sorting the range
+
+    def __init__(self, path=None, game_data=None):
+        self.path = path if path else get_run_history_path()
+        self.db = self._connect(self.path)
+        self.db.executescript(_RUN_HISTORY_SCHEMA)
+        version = self.db.execute("PRAGMA user_version").fetchone()[0]
+        if version < 1:
+            self._migrate(game_data)
+        if version < 2:
+            self._rebuild_rollup()
+        if version < RUN_HISTORY_VERSION:
+            with self.db:
+                self.db.execute(f"PRAGMA user_version = {RUN_HISTORY_VERSION}")
+
+    def _connect(self, path):
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            db = sqlite3.connect(path)
+            # WAL without full sync keeps the commit on the crash frame cheap
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            return db
+        except (OSError, sqlite3.Error) as e:
+            print(f"Warning: Could not open run history, keeping it in memory: {e}")
+            return sqlite3.connect(":memory:")
+
+    def _migrate(self, game_data):
+        # One-time import of the old top-10 list from game_data.json
+        rows = []
+        for entry in (game_data or {}).get("high_scores", []):
+            try:
+                difficulty = DIFFICULTY_MODES.index(entry.get("difficulty"))
+            except ValueError:
+                difficulty = 1
+            played_at = entry.get("date", "")
+            rows.append((played_at + ":00" if len(played_at) == 16 else played_at, int(entry.get("score", 0)),
+                         difficulty, int(entry.get("survival_time", 0)) * 60))
+        with self.db:
+            self.db.executemany(
+                "INSERT INTO runs (played_at, score, difficulty, survival_ticks) VALUES (?, ?, ?, ?)", rows)
+        if game_data is not None:
+            game_data.pop("high_scores", None)
+
+    def record(self, score, difficulty, car, seed, survival_ticks, near_misses, lane_changes, played_at=None):
+        played_at = played_at if played_at else datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self.db:
+            cursor = self.db.execute(
+                "INSERT INTO runs (played_at, score, difficulty, car, seed, survival_ticks, near_misses, lane_changes) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (played_at, score, difficulty, car, seed, survival_ticks, near_misses, lane_changes))
+            self.db.execute(
+                "INSERT INTO run_days (day, difficulty, car, best, runs) VALUES (?, ?, ?, ?, 1) "
+                "ON CONFLICT (day, difficulty, car) DO UPDATE SET best = max(best, excluded.best), runs = runs + 1",
+                (played_at[:10], difficulty, -1 if car is None else car, score))
+        return cursor.lastrowid
+
+    def _rebuild_rollup(self):
+        # Runs imported without a car are filed under car -1
+        with self.db:
+            self.db.execute("DELETE FROM run_days")
+            self.db.execute(
+                "INSERT INTO run_days (day, difficulty, car, best, runs) "
+                "SELECT substr(played_at, 1, 10), difficulty, IFNULL(car, -1), MAX(score), COUNT(*) FROM runs "
+                "GROUP BY substr(played_at, 1, 10), difficulty, IFNULL(car, -1)")
+
+    def top(self, limit=10, difficulty=None, car=None, since=None, until=None):
+        # since/until are "YYYY-MM-DD[ HH:MM:SS]" strings; until is exclusive
+        clauses, params = [], []
+        if difficulty is not None:
+            clauses.append("difficulty = ?")
+            params.append(difficulty)
+        if car is not None:
+            clauses.append("car = ?")
+            params.append(car)
+        floor = None
+        if since is not None or until is not None:
+            floor = self._score_floor(limit, clauses, params, since, until)
+        # With a floor the score indexes answer the query, so keep the planner off the date
+        # indexes (the + prefix); without one, the range is small enough to scan and sort
+        date_column = "+played_at" if floor is not None else "played_at"
+        if since is not None:
+            clauses.append(f"{date_column} >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append(f"{date_column} < ?")
+            params.append(until)
+        if floor is not None:
+            clauses.append("score >= ?")
+            params.append(floor)
+        where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+        query = f"SELECT {', '.join(_RUN_COLUMNS)} FROM runs {where}ORDER BY score DESC, id LIMIT ?"
+        return [dict(zip(_RUN_COLUMNS, row)) for row in self.db.execute(query, params + [limit])]
+
+    def _score_floor(self, limit, clauses, params, since, until):
+        # Each whole day in the range has a run scoring its rollup best, so the limit-th
+        # highest of those bests is a score the top runs are guaranteed to reach
+        full_days, all_days = list(clauses), list(clauses)
+        full_params, all_params = list(params), list(params)
+        if since is not None:
+            first_day = since[:10]
+            all_days.append("day >= ?")
+            all_params.append(first_day)
+            if since[10:].strip(" 0:"):
+                first_day = (date.fromisoformat(first_day) + timedelta(days=1)).isoformat()
+            full_days.append("day >= ?")
+            full_params.append(first_day)
+        if until is not None:
+            full_days.append("day < ?")
+            full_params.append(until[:10])
+            all_days.append("day <= ?")
+            all_params.append(until[:10])
+        row = self.db.execute(
+            f"SELECT best FROM run_days WHERE {' AND '.join(full_days)} ORDER BY best DESC LIMIT 1 OFFSET ?",
+            full_params + [limit - 1]).fetchone()
+        if row is None:
+            return None
+        floor = row[0]
+
+        # Walking a score index down to the floor visits at least one run per rollup row
+        # at or above it, anywhere in time; only worth it when that is well under the range
+        in_range = self.db.execute(
+            f"SELECT SUM(runs) FROM run_days WHERE {' AND '.join(all_days)}", all_params).fetchone()[0] or 0
+        budget = in_range // 4
+        above = self.db.execute(
+            f"SELECT COUNT(*) FROM (SELECT 1 FROM run_days WHERE {' AND '.join(clauses + ['best >= ?'])} LIMIT ?)",
+            params + [floor, budget + 1]).fetchone()[0]
+        return floor if above <= budget else None
+
+    def best(self, difficulty=None):
+        runs = self.top(1, difficulty)
+        return runs[0]["score"] if runs else 0
+
+    def count(self):
+        return self.db.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+
+    def clear(self):
+        with self.db:
+            self.db.execute("DELETE FROM runs")
+            self.db.execute("DELETE FROM run_days")
+
+    def close(self):
+        self.db.close()
+
+
+def get_replay_path():
+    return get_resource_path(os.path.join("data", "last_replay.shr"))
+
+
 def ensure_game_data_exists(game_data):
     if game_data is None:
         return load_game_data()
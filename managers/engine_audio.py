@@ -0,0 +1,69 @@
+"""
+Engine Audio Module
+SpeedyHighway v1.2.0
+
+Builds the pitch-shifted engine loops played in each speed band
+"""
+
+import os
+import sys
+import math
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from game.config import ENGINE_SPEED_BANDS, ENGINE_BANK_BYTES
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def speed_band(speed, bands=ENGINE_SPEED_BANDS):
+    band = 0
+    for i, (lowest, _) in enumerate(bands):
+        if speed >= lowest:
+            band = i
+    return band
+
+
+def pitch_shift(sound, rate):
+    samples = pygame.sndarray.array(sound)
+    frames = len(samples)
+    length = max(1, int(round(frames / rate)))
+    # Resample with wraparound so the shifted buffer still loops without a seam
+    position = np.arange(length) * (frames / length)
+    index = position.astype(np.int64)
+    weight = (position - index).astype(np.float32)
+    if samples.ndim > 1:
+        weight = weight[:, None]
+    following = samples[(index + 1) % frames].astype(np.float32)
+    shifted = samples[index].astype(np.float32)
+    shifted += (following - shifted) * weight
+    return pygame.sndarray.make_sound(shifted.astype(samples.dtype))
+
+
+def build_engine_bank(sound, bands=ENGINE_SPEED_BANDS, budget=ENGINE_BANK_BYTES):
+    # Without numpy every band plays the recorded loop unchanged
+    if np is None:
+        return [sound] * len(bands)
+    samples = pygame.sndarray.samples(sound)
+    frame_bytes = samples.strides[0]
+    bank = [None] * len(bands)
+    spent = 0
+    # Bands nearest the recorded pitch are built first while the allowance lasts
+    for i in sorted(range(len(bands)), key=lambda i: abs(math.log(bands[i][1]))):
+        rate = bands[i][1]
+        size = int(round(len(samples) / rate)) * frame_bytes
+        if rate == 1.0:
+            bank[i] = sound
+        elif spent + size <= budget:
+            bank[i] = pitch_shift(sound, rate)
+            spent += size
+    built = [i for i, buffer in enumerate(bank) if buffer is not None]
+    if not built:
+        return [sound] * len(bands)
+    return [buffer if buffer is not None else bank[min(built, key=lambda j: abs(j - i))]
+            for i, buffer in enumerate(bank)]
@@ -0,0 +1,90 @@
+"""
+Null Audio Module
+SpeedyHighway v1.2.0
+
+Stands in for SoundManager when there is no sound device, recording every call instead of playing it
+"""
+
+import os
+import sys
+from collections import Counter, deque
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game.config import NULL_AUDIO_LOG_SIZE
+
+
+class NullSoundManager:
+    def __init__(self, log_size=NULL_AUDIO_LOG_SIZE):
+        self.master_volume = 0.7
+        self.sfx_volume = 0.8
+        self.engine_volume = 0.6
+        self.music_volume = 0.5
+        self.music_playing = False
+        self.engine_loop_name = None
+        self.engine_speed = 0
+        self.frame = 0
+        # Totals per method, and the latest calls as (frame, method, args)
+        self.calls = Counter()
+        self.log = deque(maxlen=log_size)
+
+    def _record(self, method, *args):
+        self.calls[method] += 1
+        self.log.append((self.frame, method, args))
+
+    def new_frame(self):
+        self.frame += 1
+
+    def get_sound(self, sound_name):
+        self._record("get_sound", sound_name)
+        return None
+
+    def cache_stats(self):
+        return {"loaded": [], "bytes": 0, "engine_bank_bytes": 0, "loads": 0, "evictions": 0}
+
+    def prefetch(self, sound_names):
+        self._record("prefetch", tuple(sound_names))
+
+    def prefetch_for_car(self, car_type):
+        self._record("prefetch_for_car", car_type)
+
+    def play_sound(self, sound_name, volume_override=None):
+        self._record("play_sound", sound_name, volume_override)
+
+    def play_engine_sound(self, car_type, loop=True):
+        self._record("play_engine_sound", car_type, loop)
+
+    def start_engine_loop(self):
+        self._record("start_engine_loop")
+
+    def stop_engine_sound(self):
+        self._record("stop_engine_sound")
+
+    def update_engine_speed(self, speed):
+        self.engine_speed = speed
+        self._record("update_engine_speed", speed)
+
+    def set_master_volume(self, volume):
+        self.master_volume = max(0.0, min(1.0, volume))
+        self._record("set_master_volume", self.master_volume)
+
+    def cleanup(self):
+        self._record("cleanup")
+
+    def play_music(self, music_name):
+        self.music_playing = True
+        self._record("play_music", music_name)
+
+    def stop_music(self):
+        self.music_playing = False
+        self._record("stop_music")
+
+    def set_music_volume(self, volume):
+        self.music_volume = max(0.0, min(1.0, volume))
+        self._record("set_music_volume", self.music_volume)
+
+    def update_master_volume_with_music(self):
+        self._record("update_master_volume_with_music")
+
+    def call_stats(self):
+        return {"frames": self.frame, "calls": dict(self.calls)}
@@ -7,66 +7,91 @@ Checks And Handles all sound effects
 
 import os
 import sys
+import queue
+import threading
+from collections import OrderedDict
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import pygame
 
 from game.utils import get_resource_path
+from game.config import (
+    SOUND_FILES, MUSIC_FILES, SOUND_CACHE_BYTES, SOUND_PREFETCH, AUDIO_CACHE, ENGINE_SPEED_BANDS,
+    ENGINE_CROSSFADE_MS, AUDIO_BACKEND
+)
+from managers.audio_cache import AudioCache
+from managers.channel_pool import ChannelPool
+from managers.engine_audio import speed_band, build_engine_bank
+from managers.null_audio import NullSoundManager
+
+ENGINE_STARTUP_SOUNDS = {
+    0: 'engine_default',
+    1: 'engine_blue',
+    2: 'engine_red',
+    3: 'engine_special'
+}
+
+ENGINE_LOOP_SOUNDS = {
+    0: 'engine_default_loop',
+    1: 'engine_blue_loop',
+    2: 'engine_red_loop',
+    3: 'engine_special_loop'
+}
+
+GAMEPLAY_SOUNDS = ['crash', 'off_road', 'near_miss']
 
 
 class SoundManager:
-    def __init__(self):
+    def __init__(self, cache_bytes=SOUND_CACHE_BYTES, prefetch=SOUND_PREFETCH, audio_cache=AUDIO_CACHE):
         pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+        frequency, size, channels = pygame.mixer.get_init()
+        self._bytes_per_second = frequency * channels * abs(size) // 8
         self.sounds = {}
-        self.current_engine_sound = None
+        self.engine_loop_name = None
         self.engine_channel = None
         self.startup_channel = None
         self.engine_startup_playing = False
+        self.engine_speed = 0
+        self.engine_band = None
+        self.fading_channel = None
+        self._engine_bank = (None, None)
+        self.engine_bank_bytes = 0
+        self._bank_lock = threading.Lock()
         self.master_volume = 0.7
         self.sfx_volume = 0.8
         self.engine_volume = 0.6
         self.crash_channel = None
         self.music_volume = 0.5
         self.music_playing = False
+
+        # Decoded sounds, least recently played first
+        self.cache_bytes = cache_bytes
+        self._cache = OrderedDict()
+        self._cache_sizes = {}
+        self._cached_bytes = 0
+        self._loading = {}
+        self._lock = threading.Lock()
+        self.loads = 0
+        self.evictions = 0
+        self.prefetch_enabled = prefetch
+        self._prefetch_queue = None
+        self._prefetch_thread = None
+        self.audio_cache = AudioCache() if audio_cache else None
+        self.channels = ChannelPool()
         self.load_sounds()
-    
+
     def load_sounds(self):
-        sound_files = {
-            'crash': 'crash.wav',
-            'off_road': 'off_road.wav',
-            'engine_default': 'engine_default.wav',
-            'engine_default_loop': 'engine_default1.wav',
-            'engine_blue': 'engine_blue.wav',
-            'engine_blue_loop': 'engine_blue1.wav',
-            'engine_red': 'engine_red.wav',
-            'engine_red_loop': 'engine_red1.wav',
-            'engine_special': 'engine_special.wav',
-            'engine_special_loop': 'engine_special1.wav',
-            'near_miss': 'near_miss.wav',
-            'achievement': 'achievement.wav',
-            'menu_select': 'menu_select.wav',
-            'car_unlock': 'car_unlock.wav'
-        }
-        
-        music_files = {
-            'menu_music': 'menu_music.mp3',
-            'game_music': 'game_music.mp3'
-        }
-        
-        for sound_name, filename in sound_files.items():
-            try:
-                sound_path = get_resource_path(os.path.join("assets", "sounds", filename))
-                if os.path.exists(sound_path):
-                    self.sounds[sound_name] = pygame.mixer.Sound(sound_path)
-                else:
-                    self.sounds[sound_name] = None
-                    print(f"Warning: Sound file {filename} not found. Feature will be silent.")
-            except pygame.error as e:
-                print(f"Warning: Could not load sound {filename}: {e}")
+        # Only resolves paths; each sound is decoded the first time it plays
+        for sound_name, filename in SOUND_FILES.items():
+            sound_path = get_resource_path(os.path.join("assets", "sounds", filename))
+            if os.path.exists(sound_path):
+                self.sounds[sound_name] = sound_path
+            else:
                 self.sounds[sound_name] = None
-        
-        for music_name, filename in music_files.items():
+                print(f"Warning: Sound file {filename} not found. Feature will be silent.")
+
+        for music_name, filename in MUSIC_FILES.items():
             try:
                 music_path = get_resource_path(os.path.join("assets", "music", filename))
                 if os.path.exists(music_path):
@@ -77,114 +102,251 @@ class SoundManager:
             except Exception as e:
                 print(f"Warning: Could not load music {filename}: {e}")
                 self.sounds[music_name] = None
-    
+
+    def get_sound(self, sound_name):
+        with self._lock:
+            sound = self._cache.get(sound_name)
+            if sound is not None:
+                self._cache.move_to_end(sound_name)
+                return sound
+            if sound_name not in SOUND_FILES or not self.sounds.get(sound_name):
+                return None
+            loading = self._loading.get(sound_name)
+            if loading is None:
+                loading = self._loading[sound_name] = threading.Event()
+                owner = True
+            else:
+                owner = False
+
+        if not owner:
+            # Already being decoded by the prefetch thread
+            loading.wait()
+            with self._lock:
+                return self._cache.get(sound_name)
+
+        sound = None
+        try:
+            if self.audio_cache:
+                sound = self.audio_cache.load(self.sounds[sound_name])
+            else:
+                sound = pygame.mixer.Sound(self.sounds[sound_name])
+        except (pygame.error, OSError) as e:
+            print(f"Warning: Could not load sound {SOUND_FILES[sound_name]}: {e}")
+        with self._lock:
+            del self._loading[sound_name]
+            if sound is None:
+                self.sounds[sound_name] = None
+            else:
+                self._cache[sound_name] = sound
+                self._cache_sizes[sound_name] = int(sound.get_length() * self._bytes_per_second)
+                self._cached_bytes += self._cache_sizes[sound_name]
+                self.loads += 1
+                self._evict(sound_name)
+        loading.set()
+        return sound
+
+    def _evict(self, keep):
+        # Drop the least recently played sounds that are not in use; channels
+        # hold their own reference, so a sound still playing is never cut off
+        in_use = (keep, self.engine_loop_name)
+        for name in list(self._cache):
+            if self._cached_bytes <= self.cache_bytes:
+                break
+            if name in in_use:
+                continue
+            del self._cache[name]
+            self._cached_bytes -= self._cache_sizes.pop(name)
+            self.evictions += 1
+
+    def cache_stats(self):
+        with self._lock:
+            return {"loaded": list(self._cache), "bytes": self._cached_bytes,
+                    "engine_bank_bytes": self.engine_bank_bytes,
+                    "loads": self.loads, "evictions": self.evictions}
+
+    def prefetch(self, sound_names):
+        if not self.prefetch_enabled:
+            return
+        if self._prefetch_queue is None:
+            self._prefetch_queue = queue.Queue()
+            self._prefetch_thread = threading.Thread(target=self._prefetch_worker, name="sound-prefetch", daemon=True)
+            self._prefetch_thread.start()
+        for name in sound_names:
+            self._prefetch_queue.put(name)
+
+    def prefetch_for_car(self, car_type):
+        self.prefetch([ENGINE_STARTUP_SOUNDS.get(car_type, 'engine_default'),
+                       ENGINE_LOOP_SOUNDS.get(car_type, 'engine_default_loop')] + GAMEPLAY_SOUNDS)
+
+    def _prefetch_worker(self):
+        while True:
+            name = self._prefetch_queue.get()
+            if name is None:
+                return
+            with self._lock:
+                cached = name in self._cache
+            if not cached:
+                self.get_sound(name)
+            if name in ENGINE_LOOP_SOUNDS.values():
+                self.engine_bank(name)
+
+    def engine_bank(self, loop_name):
+        # Pitch-shifted loops for every speed band, kept for the current car only
+        with self._bank_lock:
+            name, bank = self._engine_bank
+            if name != loop_name:
+                sound = self.get_sound(loop_name)
+                if sound is None:
+                    return None
+                try:
+                    bank = build_engine_bank(sound)
+                except (pygame.error, ValueError, MemoryError) as e:
+                    print(f"Warning: Could not build engine pitch bands, engine pitch will not follow speed: {e}")
+                    bank = None
+                if not bank:
+                    bank = [sound] * len(ENGINE_SPEED_BANDS)
+                # Counted against ENGINE_BANK_BYTES; the recorded loop itself is in the LRU
+                shifted = {id(buffer): buffer for buffer in bank if buffer is not sound}
+                self.engine_bank_bytes = sum(int(buffer.get_length() * self._bytes_per_second)
+                                             for buffer in shifted.values())
+                self._engine_bank = (loop_name, bank)
+            return bank
+
     def play_sound(self, sound_name, volume_override=None):
-        if sound_name in self.sounds and self.sounds[sound_name]:
+        if not self.channels.can_start(sound_name):
+            return
+        sound = self.get_sound(sound_name)
+        if sound:
             try:
-                sound = self.sounds[sound_name]
                 volume = volume_override if volume_override else self.sfx_volume * self.master_volume
                 sound.set_volume(volume)
                 
-                if sound_name == 'crash':
-                    if self.crash_channel:
-                        self.crash_channel.stop()
-                    self.crash_channel = sound.play()
-                    if self.crash_channel:
-                        self.crash_channel.set_volume(min(1.0, volume * 1.2))
-                else:
-                    sound.play()
+                channel = self.channels.play(sound_name, sound)
+                if sound_name == 'crash' and channel:
+                    self.crash_channel = channel
+                    self.crash_channel.set_volume(min(1.0, volume * 1.2))
             except pygame.error as e:
                 print(f"Error playing sound {sound_name}: {e}")
     
+    def new_frame(self):
+        self.channels.new_frame()
+
     def play_engine_sound(self, car_type, loop=True):
-        startup_sounds = {
-            0: 'engine_default',
-            1: 'engine_blue', 
-            2: 'engine_red',
-            3: 'engine_special'
-        }
-        
-        loop_sounds = {
-            0: 'engine_default_loop',
-            1: 'engine_blue_loop', 
-            2: 'engine_red_loop',
-            3: 'engine_special_loop'
-        }
-        
-        startup_sound_name = startup_sounds.get(car_type, 'engine_default')
-        loop_sound_name = loop_sounds.get(car_type, 'engine_default_loop')
+        startup_sound_name = ENGINE_STARTUP_SOUNDS.get(car_type, 'engine_default')
+        loop_sound_name = ENGINE_LOOP_SOUNDS.get(car_type, 'engine_default_loop')
         
         self.stop_engine_sound()
+        startup_sound = self.get_sound(startup_sound_name)
         
-        if loop and startup_sound_name in self.sounds and self.sounds[startup_sound_name]:
+        if loop and startup_sound:
             try:
-                startup_sound = self.sounds[startup_sound_name]
-                self.startup_channel = startup_sound.play()
+                self.startup_channel = self.channels.play(startup_sound_name, startup_sound)
                 if self.startup_channel:
                     self.startup_channel.set_volume(self.engine_volume * self.master_volume)
                     self.engine_startup_playing = True
                     
-                if loop_sound_name in self.sounds and self.sounds[loop_sound_name]:
-                    self.current_engine_sound = self.sounds[loop_sound_name]
+                if self.sounds.get(loop_sound_name):
+                    # Decode the loop while the startup sound plays
+                    self.engine_loop_name = loop_sound_name
+                    self.prefetch([loop_sound_name])
                     startup_length = int(startup_sound.get_length() * 1000)
                     pygame.time.set_timer(pygame.USEREVENT + 1, startup_length)
                     
             except pygame.error as e:
                 print(f"Error playing engine startup sound: {e}")
-        elif not loop and startup_sound_name in self.sounds and self.sounds[startup_sound_name]:
+        elif not loop and startup_sound:
             try:
-                startup_sound = self.sounds[startup_sound_name]
-                self.startup_channel = startup_sound.play()
+                self.startup_channel = self.channels.play(startup_sound_name, startup_sound)
                 if self.startup_channel:
                     self.startup_channel.set_volume(self.engine_volume * self.master_volume)
             except pygame.error as e:
                 print(f"Error playing engine preview sound: {e}")
     
     def start_engine_loop(self):
-        if self.current_engine_sound and not self.engine_channel:
+        bank = self.engine_bank(self.engine_loop_name) if self.engine_loop_name else None
+        if bank and not self.engine_channel:
             try:
-                self.engine_channel = self.current_engine_sound.play(-1)
+                self.engine_band = speed_band(self.engine_speed)
+                self.engine_channel = self.channels.play(self.engine_loop_name, bank[self.engine_band], loops=-1)
                 if self.engine_channel:
-                    self.engine_channel.set_volume(self.engine_volume * self.master_volume)
+                    self.engine_channel.set_volume(self._engine_level())
                 self.engine_startup_playing = False
             except pygame.error as e:
                 print(f"Error playing engine loop sound: {e}")
     
     def stop_engine_sound(self):
-        if self.engine_channel:
-            self.engine_channel.stop()
-            self.engine_channel = None
-        if self.startup_channel:
-            self.startup_channel.stop()
-            self.startup_channel = None
-        self.current_engine_sound = None
+        self.channels.stop(self.engine_channel)
+        self.engine_channel = None
+        self.channels.stop(self.startup_channel)
+        self.startup_channel = None
+        self.channels.stop(self.fading_channel)
+        self.fading_channel = None
+        self.engine_band = None
+        self.engine_loop_name = None
         self.engine_startup_playing = False
         pygame.time.set_timer(pygame.USEREVENT + 1, 0)
     
-    def update_engine_volume(self, speed_factor):
+    def update_engine_speed(self, speed):
+        # The mixer is only touched when the speed crosses into another band
+        self.engine_speed = speed
+        band = speed_band(speed)
+        if band == self.engine_band:
+            return
         if self.engine_channel:
-            volume = min(1.0, 0.3 + (speed_factor * 0.7))
-            final_volume = volume * self.engine_volume * self.master_volume
-            self.engine_channel.set_volume(final_volume)
-        if self.startup_channel and self.engine_startup_playing:
-            volume = min(1.0, 0.3 + (speed_factor * 0.7))
-            final_volume = volume * self.engine_volume * self.master_volume
-            self.startup_channel.set_volume(final_volume)
+            self._crossfade_engine(band)
+        elif self.startup_channel and self.engine_startup_playing:
+            self.startup_channel.set_volume(self._engine_level())
+        self.engine_band = band
+
+    def _crossfade_engine(self, band):
+        bank = self.engine_bank(self.engine_loop_name)
+        if not bank:
+            return
+        old_channel = self.engine_channel
+        try:
+            channel = self.channels.play(self.engine_loop_name, bank[band], loops=-1, fade_ms=ENGINE_CROSSFADE_MS)
+        except pygame.error as e:
+            print(f"Error playing engine loop sound: {e}")
+            return
+        if channel is None:
+            return
+        channel.set_volume(self._engine_level())
+        if old_channel is not channel:
+            old_channel.fadeout(ENGINE_CROSSFADE_MS)
+            self.fading_channel = old_channel
+        self.engine_channel = channel
+
+    def _engine_level(self):
+        volume = min(1.0, 0.3 + min(1.0, self.engine_speed / 20.0) * 0.7)
+        return volume * self.engine_volume * self.master_volume
     
     def set_master_volume(self, volume):
         self.master_volume = max(0.0, min(1.0, volume))
         if self.engine_channel:
-            self.engine_channel.set_volume(self.engine_volume * self.master_volume)
+            self.engine_channel.set_volume(self._engine_level())
         if self.startup_channel and self.engine_startup_playing:
-            self.startup_channel.set_volume(self.engine_volume * self.master_volume)
+            self.startup_channel.set_volume(self._engine_level())
         self.update_master_volume_with_music()
     
+    def _stop_prefetch(self):
+        # Drop queued work and let the current decode finish before the mixer closes
+        if self._prefetch_queue is None:
+            return
+        while True:
+            try:
+                self._prefetch_queue.get_nowait()
+            except queue.Empty:
+                break
+        self._prefetch_queue.put(None)
+        self._prefetch_thread.join()
+        self._prefetch_queue = None
+
     def cleanup(self):
+        self._stop_prefetch()
         self.stop_engine_sound()
         self.stop_music()
-        if self.crash_channel:
-            self.crash_channel.stop()
-            self.crash_channel = None
+        self.channels.stop(self.crash_channel)
+        self.crash_channel = None
         pygame.mixer.quit()
     
     def play_music(self, music_name):
@@ -213,3 +375,15 @@ class SoundManager:
     def update_master_volume_with_music(self):
         if self.music_playing:
             pygame.mixer.music.set_volume(self.music_volume * self.master_volume)
+
+
+def create_sound_manager(backend=AUDIO_BACKEND):
+    if backend == "null":
+        return NullSoundManager()
+    try:
+        return SoundManager()
+    except pygame.error as e:
+        if backend == "mixer":
+            raise
+        print(f"Warning: No audio device available, running without sound: {e}")
+        return NullSoundManager()
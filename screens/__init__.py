@@ -2,9 +2,39 @@
 Screens module for SpeedyHighway
 """
 
-from .menu import display_main_menu, display_seed_input, display_quit_confirmation
-from .game_screen import display_enhanced_hud, display_pause_menu, display_countdown_timer, display_credit
-from .game_over import display_game_over_screen
-from .high_scores import display_high_scores
-from .achievements import display_achievements
-from .car_selection import display_car_selection
+import importlib
+
+_EXPORTS = {
+    "display_main_menu": "menu",
+    "display_seed_input": "menu",
+    "display_quit_confirmation": "menu",
+    "display_enhanced_hud": "game_screen",
+    "display_pause_menu": "game_screen",
+    "display_countdown_timer": "game_screen",
+    "display_credit": "game_screen",
+    "display_game_over_screen": "game_over",
+    "display_high_scores": "high_scores",
+    "display_achievements": "achievements",
+    "display_car_selection": "car_selection",
+    "get_font": "fonts",
+    "font_stats": "fonts",
+    "render_label": "labels",
+    "label_stats": "labels",
+    "LabelSlot": "labels",
+    "draw_panel": "panels",
+    "draw_box": "panels",
+    "get_panel": "panels",
+    "get_overlay": "panels"
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    # Resolve an export on first use and keep it, so the package import stays cheap
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
@@ -9,23 +9,26 @@ import sys
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-import pygame
-
 from game.config import (
     DISPLAY_WIDTH, DISPLAY_HEIGHT,
     BLACK, WHITE, GREEN, RED, YELLOW
 )
+from screens.fonts import get_font
+from screens.labels import render_label
+from screens.panels import draw_panel
+from screens.frames import FrameCache, background_key
 
 
-def draw_panel(surface, width, height, x, y, alpha=160, border_color=(64, 64, 64)):
-    panel = pygame.Surface((width, height))
-    panel.set_alpha(alpha)
-    panel.fill(BLACK)
-    pygame.draw.rect(panel, border_color, (0, 0, width, height), 3)
-    surface.blit(panel, (x, y))
+_frame = FrameCache()
 
 
 def display_achievements(surface, game_state):
+    key = (game_state.game_data_version, game_state.reset_confirmation_active,
+           id(game_state.achievements), background_key(game_state))
+    _frame.draw(surface, key, lambda frame: _draw_achievements(frame, game_state))
+
+
+def _draw_achievements(surface, game_state):
     surface.fill(BLACK)
     
     # Background
@@ -36,9 +39,9 @@ def display_achievements(surface, game_state):
         surface.blit(game_state.menu_bg_icon_faded, (x, y))
     
     # Fonts
-    font_title = pygame.font.SysFont("arial bold",54, True)
-    font_text = pygame.font.SysFont("consolas", 18)
-    font_small = pygame.font.SysFont("consolas", 15)
+    font_title = get_font("arial bold",54, True)
+    font_text = get_font("consolas", 18)
+    font_small = get_font("consolas", 15)
     
     if game_state.reset_confirmation_active:
         _display_reset_confirmation(surface, font_title, font_text, font_small)
@@ -54,10 +57,10 @@ def _display_reset_confirmation(surface, font_title, font_text, font_small):
                alpha=200, border_color=(128, 128, 128))
     
     # Title
-    title = font_title.render("RESET PROGRESS", True, RED)
+    title = render_label(font_title, "RESET PROGRESS", RED)
     surface.blit(title, (400 - title.get_width() // 2, panel_y + 30))
     
-    warning_text = font_title.render("WARNING!", True, RED)
+    warning_text = render_label(font_title, "WARNING!", RED)
     surface.blit(warning_text, (400 - warning_text.get_width() // 2, panel_y + 90))
     
     # Warning lines
@@ -72,14 +75,14 @@ def _display_reset_confirmation(surface, font_title, font_text, font_small):
     ]
     
     for i, line in enumerate(confirm_lines):
-        text = font_text.render(line, True, WHITE)
+        text = render_label(font_text, line, WHITE)
         surface.blit(text, (400 - text.get_width() // 2, panel_y + 140 + i * 25))
     
     # Options
-    yes_text = font_title.render("Y - YES, DELETE EVERYTHING", True, RED)
+    yes_text = render_label(font_title, "Y - YES, DELETE EVERYTHING", RED)
     surface.blit(yes_text, (400 - yes_text.get_width() // 2, panel_y + 310))
     
-    no_text = font_title.render("N - NO, KEEP MY DATA", True, GREEN)
+    no_text = render_label(font_title, "N - NO, KEEP MY DATA", GREEN)
     surface.blit(no_text, (400 - no_text.get_width() // 2, panel_y + 350))
 
 
@@ -90,7 +93,7 @@ def _display_achievements_list(surface, game_state, font_title, font_text, font_
     draw_panel(surface, panel_width, panel_height, panel_x, panel_y)
     
     # Title
-    title = font_title.render("A C H I E V E M E N T S", True,(0,255,200))
+    title = render_label(font_title, "A C H I E V E M E N T S", (0,255,200))
     surface.blit(title, (400 - title.get_width() // 2, panel_y + 30))
     
     # Achievements list
@@ -98,7 +101,7 @@ def _display_achievements_list(surface, game_state, font_title, font_text, font_
         color = GREEN if achievement.unlocked else RED
         status = "[UNLOCKED]" if achievement.unlocked else "[LOCKED]"
         text = f"{status} {achievement.name}: {achievement.description}"
-        rendered_text = font_text.render(text, True, color)
+        rendered_text = render_label(font_text, text, color)
         surface.blit(rendered_text, (panel_x + 20, panel_y + 100 + i * 30))
     
     # Instructions
@@ -109,5 +112,5 @@ def _display_achievements_list(surface, game_state, font_title, font_text, font_
     
     for i, instruction in enumerate(instructions):
         color = YELLOW if i == 0 else RED
-        text = font_small.render(instruction, True, color)
+        text = render_label(font_small, instruction, color)
         surface.blit(text, (panel_x + 20, panel_y + 400 + i * 20))
@@ -8,24 +8,27 @@ import sys
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-import pygame
-
 from game.config import (
     DISPLAY_WIDTH, DISPLAY_HEIGHT,
     BLACK, WHITE, BLUE, YELLOW,
     CAR_NAMES
 )
+from screens.fonts import get_font
+from screens.labels import render_label
+from screens.panels import draw_panel
+from screens.frames import FrameCache, background_key
 
 
-def draw_panel(surface, width, height, x, y, alpha=200):
-    panel = pygame.Surface((width, height))
-    panel.set_alpha(alpha)
-    panel.fill(BLACK)
-    pygame.draw.rect(panel, (64, 64, 64), (0, 0, width, height), 3)
-    surface.blit(panel, (x, y))
+_frame = FrameCache()
 
 
 def display_car_selection(surface, game_state):
+    key = (game_state.game_data_version, game_state.current_car,
+           id(game_state.carImg), background_key(game_state))
+    _frame.draw(surface, key, lambda frame: _draw_car_selection(frame, game_state))
+
+
+def _draw_car_selection(surface, game_state):
     surface.fill(BLACK)
 
     center_x = DISPLAY_WIDTH // 2
@@ -42,16 +45,16 @@ def display_car_selection(surface, game_state):
     panel_width, panel_height = 600, 450
     panel_x = (DISPLAY_WIDTH - panel_width) // 2
     panel_y = (DISPLAY_HEIGHT - panel_height) // 2
-    draw_panel(surface, panel_width, panel_height, panel_x, panel_y)
+    draw_panel(surface, panel_width, panel_height, panel_x, panel_y, alpha=200)
 
     # Fonts (consistent with menu & game over)
-    font_title = pygame.font.SysFont("impact", 60)
-    font_car = pygame.font.SysFont("bahnschrift", 32, True)
-    font_selected = pygame.font.SysFont("bahnschrift", 36, True)
-    font_instructions = pygame.font.SysFont("bahnschrift", 22)
+    font_title = get_font("impact", 60)
+    font_car = get_font("bahnschrift", 32, True)
+    font_selected = get_font("bahnschrift", 36, True)
+    font_instructions = get_font("bahnschrift", 22)
 
     # Title
-    title = font_title.render("CAR SELECTION", True, YELLOW)
+    title = render_label(font_title, "CAR SELECTION", YELLOW)
     surface.blit(title, (center_x - title.get_width() // 2, panel_y + 30))
 
     # Car preview
@@ -69,10 +72,10 @@ def display_car_selection(surface, game_state):
 
         if car_index == game_state.current_car:
             color = YELLOW
-            text = font_selected.render(f"> {car_name} <", True, color)
+            text = render_label(font_selected, f"> {car_name} <", color)
         else:
             color = WHITE
-            text = font_car.render(car_name, True, color)
+            text = render_label(font_car, car_name, color)
 
         surface.blit(
             text,
@@ -87,7 +90,7 @@ def display_car_selection(surface, game_state):
     ]
 
     for i, instruction in enumerate(instructions):
-        text = font_instructions.render(instruction, True, WHITE)
+        text = render_label(font_instructions, instruction, WHITE)
         surface.blit(
             text,
             (center_x - text.get_width() // 2, panel_y + 360 + i * 25)
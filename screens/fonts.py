@@ -0,0 +1,44 @@
+"""
+Font Registry
+SpeedyHighway v1.2.0
+
+Builds each SysFont once and shares it across all screens.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+
+_fonts = {}
+_stats = {"hits": 0, "misses": 0}
+
+
+def get_font(family, size, bold=False):
+    key = (family, size, bool(bold))
+    font = _fonts.get(key)
+    if font is None:
+        _stats["misses"] += 1
+        font = pygame.font.SysFont(family, size, bold)
+        _fonts[key] = font
+    else:
+        _stats["hits"] += 1
+    return font
+
+
+def font_stats():
+    lookups = _stats["hits"] + _stats["misses"]
+    return {
+        "fonts": len(_fonts),
+        "hits": _stats["hits"],
+        "misses": _stats["misses"],
+        "hit_rate": _stats["hits"] / lookups if lookups else 0.0,
+    }
+
+
+def clear_fonts():
+    _fonts.clear()
+    _stats["hits"] = _stats["misses"] = 0
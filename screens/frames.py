@@ -0,0 +1,37 @@
+"""
+Screen Frame Cache
+SpeedyHighway v1.2.0
+
+Renders a static screen once and replays it until its inputs change.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+
+class FrameCache:
+    def __init__(self):
+        self._frame = None
+        self._key = None
+        self.renders = 0
+
+    def draw(self, surface, key, draw_func):
+        if self._frame is None or self._frame.get_size() != surface.get_size():
+            self._frame = pygame.Surface(surface.get_size(), 0, surface)
+            self._key = None
+        if key != self._key:
+            draw_func(self._frame)
+            self._key = key
+            self.renders += 1
+        surface.blit(self._frame, (0, 0))
+
+    def invalidate(self):
+        self._key = None
+
+
+def background_key(game_state):
+    return id(getattr(game_state, 'menu_bg_icon_faded', None))
@@ -15,22 +15,34 @@ from game.config import (
     BLACK, WHITE, RED, YELLOW,
     DIFFICULTY_MODES
 )
+from screens.fonts import get_font
+from screens.labels import render_label
+from screens.frames import FrameCache
+
+
+_frame = FrameCache()
 
 
 def display_game_over_screen(surface, game_state):
+    key = (game_state.game_data_version, game_state.games_played,
+           game_state.total_score)
+    _frame.draw(surface, key, lambda frame: _draw_game_over_screen(frame, game_state))
+
+
+def _draw_game_over_screen(surface, game_state):
     surface.fill(BLACK)
 
     screen_w = surface.get_width()
     center_x = screen_w // 2
 
     # Fonts (gamified but safe)
-    font_title = pygame.font.SysFont("impact", 80)
-    font_text = pygame.font.SysFont("consolas", 32, True)
-    font_small = pygame.font.SysFont("consolas", 24)
+    font_title = get_font("impact", 80)
+    font_text = get_font("consolas", 32, True)
+    font_small = get_font("consolas", 24)
 
     # Title
         # Title
-    title = font_title.render("G  A  M  E  O  V  E  R", True, RED)
+    title = render_label(font_title, "G  A  M  E  O  V  E  R", RED)
     title_y = 100
     surface.blit(title, (center_x - title.get_width() // 2, title_y))
 
@@ -59,9 +71,12 @@ def display_game_over_screen(surface, game_state):
 
     start_y = 220
     for i, stat in enumerate(stats):
-        text = font_text.render(stat, True, WHITE)
+        text = render_label(font_text, stat, WHITE)
         surface.blit(text, (center_x - text.get_width() // 2, start_y + i * 36))
 
     # Instruction
-    instruction = font_small.render("Press SPACE to return to menu", True, YELLOW)
+    instruction = render_label(font_small, "Press SPACE to return to menu", YELLOW)
     surface.blit(instruction, (center_x - instruction.get_width() // 2, 520))
+
+    replay_hint = render_label(font_small, "R - Watch replay (1/2/3 = 1x/8x/MAX)", WHITE)
+    surface.blit(replay_hint, (center_x - replay_hint.get_width() // 2, 550))
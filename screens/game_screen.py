@@ -9,70 +9,84 @@ import sys
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-import pygame
-
 from game.config import (
-    DISPLAY_WIDTH, DISPLAY_HEIGHT,
-    BLACK, WHITE, GREEN, RED, BLUE, YELLOW,
+    WHITE, GREEN, RED, BLUE, YELLOW,
     DIFFICULTY_MODES
 )
+from screens.fonts import get_font
+from screens.labels import render_label, LabelSlot
+from screens.panels import get_overlay
+
+
+_hud_labels = {
+    "score": LabelSlot("consolas", 24),
+    "bonus": LabelSlot("consolas", 18),
+    "near_miss": LabelSlot("consolas", 18),
+    "lanes": LabelSlot("consolas", 18),
+    "speed": LabelSlot("consolas", 18),
+    "difficulty": LabelSlot("consolas", 18),
+    "time": LabelSlot("consolas", 18),
+    "replay": LabelSlot("consolas", 18, True),
+}
 
 
 def display_enhanced_hud(surface, game_state):
-    font = pygame.font.SysFont("consolas", 24)
-    font_small = pygame.font.SysFont("consolas", 18)
+    labels = _hud_labels
+    rects = {}
     
     # Score
-    score_text = font.render(f"Score: {game_state.total_score}", True, WHITE)
-    surface.blit(score_text, (10, 10))
+    score_text = labels["score"].render(f"Score: {game_state.total_score}", WHITE)
+    rects["score"] = surface.blit(score_text, (10, 10))
     
     # Bonus
-    bonus_text = font_small.render(f"Bonus: {game_state.bonus_score}", True, YELLOW)
-    surface.blit(bonus_text, (10, 35))
+    bonus_text = labels["bonus"].render(f"Bonus: {game_state.bonus_score}", YELLOW)
+    rects["bonus"] = surface.blit(bonus_text, (10, 35))
     
     # Near misses with flash effect
-    near_miss_color = WHITE
-    if game_state.near_miss_flash_timer > 0:
-        near_miss_color = GREEN
-        game_state.near_miss_flash_timer -= 1
+    near_miss_color = GREEN if game_state.near_miss_flash_timer > 0 else WHITE
     
-    near_miss_text = font_small.render(f"Near Misses: {game_state.near_miss_count}", True, near_miss_color)
-    surface.blit(near_miss_text, (10, 55))
+    near_miss_text = labels["near_miss"].render(f"Near Misses: {game_state.near_miss_count}", near_miss_color)
+    rects["near_miss"] = surface.blit(near_miss_text, (10, 55))
     
     # Lane changes
-    lane_text = font_small.render(f"Lane Changes: {game_state.lane_change_count}", True, BLUE)
-    surface.blit(lane_text, (10, 75))
+    lane_text = labels["lanes"].render(f"Lane Changes: {game_state.lane_change_count}", BLUE)
+    rects["lane"] = surface.blit(lane_text, (10, 75))
     
     # Speed (right side)
-    speed_text = font_small.render(f"Speed: {game_state.enemy_car_speed}", True, RED)
-    surface.blit(speed_text, (650, 10))
+    speed_text = labels["speed"].render(f"Speed: {game_state.enemy_car_speed}", RED)
+    rects["speed"] = surface.blit(speed_text, (650, 10))
     
     # Difficulty
-    diff_text = font_small.render(f"Difficulty: {DIFFICULTY_MODES[game_state.current_difficulty]}", True, WHITE)
-    surface.blit(diff_text, (650, 30))
+    diff_text = labels["difficulty"].render(f"Difficulty: {DIFFICULTY_MODES[game_state.current_difficulty]}", WHITE)
+    rects["diff"] = surface.blit(diff_text, (650, 30))
     
     # Survival time
     survival_seconds = game_state.survival_time // 60
-    time_text = font_small.render(f"Time: {survival_seconds}s", True, WHITE)
-    surface.blit(time_text, (650, 50))
+    time_text = labels["time"].render(f"Time: {survival_seconds}s", WHITE)
+    rects["time"] = surface.blit(time_text, (650, 50))
+    
+    # Replay playback indicator
+    if game_state.replay_active:
+        speed = f"{game_state.replay_speed}x" if game_state.replay_speed else "MAX"
+        replay_text = labels["replay"].render(f"REPLAY {speed}", YELLOW)
+        rects["replay"] = surface.blit(replay_text, (650, 70))
+
+    return rects
 
 
 def display_pause_menu(surface):
     # Overlay
-    overlay = pygame.Surface((DISPLAY_WIDTH, DISPLAY_HEIGHT))
-    overlay.set_alpha(128)
-    overlay.fill(BLACK)
-    surface.blit(overlay, (0, 0))
+    surface.blit(get_overlay(128), (0, 0))
     
     # Pause text
-    font = pygame.font.SysFont("impact", 72, True)
-    pause_text = font.render("PAUSED", True, WHITE)
+    font = get_font("impact", 72, True)
+    pause_text = render_label(font, "PAUSED", WHITE)
     surface.blit(pause_text, (400 - pause_text.get_width() // 2, 200 - pause_text.get_height() // 2))
     
     # Instructions
-    font_small = pygame.font.SysFont("consolas", 20)
-    instruction1 = font_small.render("Press ESC to Resume", True, WHITE)
-    instruction2 = font_small.render("Click on window to resume", True, WHITE)
+    font_small = get_font("consolas", 20)
+    instruction1 = render_label(font_small, "Press ESC to Resume", WHITE)
+    instruction2 = render_label(font_small, "Click on window to resume", WHITE)
     surface.blit(instruction1, (400 - instruction1.get_width() // 2, 280))
     surface.blit(instruction2, (400 - instruction2.get_width() // 2, 310))
 
@@ -81,31 +95,28 @@ def display_countdown_timer(surface, unpause_timer):
     countdown_number = (unpause_timer // 60) + 1
     
     # Overlay
-    overlay = pygame.Surface((DISPLAY_WIDTH, DISPLAY_HEIGHT))
-    overlay.set_alpha(100)
-    overlay.fill(BLACK)
-    surface.blit(overlay, (0, 0))
+    surface.blit(get_overlay(100), (0, 0))
     
     # Countdown number
-    font = pygame.font.SysFont("impact", 120, True)
-    countdown_text = font.render(str(countdown_number), True, WHITE)
+    font = get_font("impact", 120, True)
+    countdown_text = render_label(font, str(countdown_number), WHITE)
     surface.blit(countdown_text, (400 - countdown_text.get_width() // 2, 300 - countdown_text.get_height() // 2))
     
     # Ready text
-    font_small = pygame.font.SysFont("consolas", 36, True)
-    ready_text = font_small.render("Get Ready!", True, WHITE)
+    font_small = get_font("consolas", 36, True)
+    ready_text = render_label(font_small, "Get Ready!", WHITE)
     surface.blit(ready_text, (400 - ready_text.get_width() // 2, 200 - ready_text.get_height() // 2))
 
 
 def display_credit(surface):
     from game.config import __version__
     
-    font = pygame.font.SysFont("consolas", 14)
-    text = font.render(f"SpeedyHighway v{__version__}", True, WHITE)
+    font = get_font("consolas", 14)
+    text = render_label(font, f"SpeedyHighway v{__version__}", WHITE)
     surface.blit(text, (600, 500))
-    text = font.render("Thanks & Regards,", True, WHITE)
+    text = render_label(font, "Thanks & Regards,", WHITE)
     surface.blit(text, (600, 520))
-    text = font.render("Tanay Vidhate", True, WHITE)
+    text = render_label(font, "Tanay Vidhate", WHITE)
     surface.blit(text, (600, 540))
-    text = font.render("(WARlord05)", True, WHITE)
+    text = render_label(font, "(WARlord05)", WHITE)
     surface.blit(text, (600, 560))
@@ -16,17 +16,21 @@ from game.config import (
     BLACK, WHITE, GREEN, YELLOW,
     DIFFICULTY_MODES
 )
+from screens.fonts import get_font
+from screens.labels import render_label
+from screens.panels import draw_panel
+from screens.frames import FrameCache, background_key
 
 
-def draw_panel(surface, width, height, x, y, alpha=180):
-    panel = pygame.Surface((width, height))
-    panel.set_alpha(alpha)
-    panel.fill(BLACK)
-    pygame.draw.rect(panel, (64, 64, 64), (0, 0, width, height), 3)
-    surface.blit(panel, (x, y))
+_frame = FrameCache()
 
 
 def display_high_scores(surface, game_state):
+    key = (game_state.game_data_version, background_key(game_state))
+    _frame.draw(surface, key, lambda frame: _draw_high_scores(frame, game_state))
+
+
+def _draw_high_scores(surface, game_state):
     surface.fill(BLACK)
     center_x = DISPLAY_WIDTH // 2
 
@@ -41,16 +45,16 @@ def display_high_scores(surface, game_state):
     panel_width, panel_height = 700, 470
     panel_x = (DISPLAY_WIDTH - panel_width) // 2
     panel_y = (DISPLAY_HEIGHT - panel_height) // 2
-    draw_panel(surface, panel_width, panel_height, panel_x, panel_y)
+    draw_panel(surface, panel_width, panel_height, panel_x, panel_y, alpha=180)
 
     # Fonts (consistent with rest of UI)
-    font_title = pygame.font.SysFont("impact", 56)
-    font_text = pygame.font.SysFont("bahnschrift", 22)
-    font_highlight = pygame.font.SysFont("bahnschrift", 26, True)
-    font_instruction = pygame.font.SysFont("bahnschrift", 20)
+    font_title = get_font("impact", 56)
+    font_text = get_font("bahnschrift", 22)
+    font_highlight = get_font("bahnschrift", 26, True)
+    font_instruction = get_font("bahnschrift", 20)
 
     # Title
-    title = font_title.render("HIGH SCORES", True, YELLOW)
+    title = render_label(font_title, "HIGH SCORES", YELLOW)
     surface.blit(title, (center_x - title.get_width() // 2, panel_y + 25))
 
     # Divider
@@ -67,17 +71,17 @@ def display_high_scores(surface, game_state):
 
     if best_score_in_highest_diff > 0:
         highlight_text = f"BEST ({DIFFICULTY_MODES[highest_difficulty]}): {best_score_in_highest_diff}"
-        highlight_render = font_highlight.render(highlight_text, True, GREEN)
+        highlight_render = render_label(font_highlight, highlight_text, GREEN)
         surface.blit(highlight_render,
                      (center_x - highlight_render.get_width() // 2, panel_y + 105))
         list_start_y += 40
 
     # High scores list (center aligned)
-    high_scores = game_state.game_data.get("high_scores", [])
+    high_scores = game_state.run_history.top(10)
 
-    for i, score_data in enumerate(high_scores[:10]):
-        score_text = f"{i+1}.  {score_data['score']}   |   {score_data['difficulty']}   |   {score_data['date']}"
-        text = font_text.render(score_text, True, WHITE)
+    for i, run in enumerate(high_scores):
+        score_text = f"{i+1}.  {run['score']}   |   {DIFFICULTY_MODES[run['difficulty']]}   |   {run['played_at'][:16]}"
+        text = render_label(font_text, score_text, WHITE)
         surface.blit(text, (center_x - text.get_width() // 2, list_start_y + i * 30))
 
     # Bottom divider
@@ -86,6 +90,6 @@ def display_high_scores(surface, game_state):
                      (panel_x + panel_width - 40, panel_y + panel_height - 70), 1)
 
     # Instruction
-    instruction = font_instruction.render("Press ESC to return to menu", True, YELLOW)
+    instruction = render_label(font_instruction, "Press ESC to return to menu", YELLOW)
     surface.blit(instruction,
                  (center_x - instruction.get_width() // 2, panel_y + panel_height - 50))
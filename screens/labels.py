@@ -0,0 +1,69 @@
+"""
+Text Label Cache
+SpeedyHighway v1.2.0
+
+Keeps rendered text surfaces so screens only rasterize text when it changes.
+"""
+
+import os
+import sys
+from collections import OrderedDict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from screens.fonts import get_font
+
+
+LABEL_CACHE_SIZE = 256
+
+_labels = OrderedDict()
+_stats = {"hits": 0, "misses": 0}
+
+
+def render_label(font, text, color, antialias=True):
+    key = (font, text, tuple(color), antialias)
+    surface = _labels.get(key)
+    if surface is not None:
+        _labels.move_to_end(key)
+        _stats["hits"] += 1
+        return surface
+
+    _stats["misses"] += 1
+    surface = font.render(text, antialias, color)
+    _labels[key] = surface
+    if len(_labels) > LABEL_CACHE_SIZE:
+        _labels.popitem(last=False)
+    return surface
+
+
+def label_stats():
+    return {
+        "labels": len(_labels),
+        "hits": _stats["hits"],
+        "misses": _stats["misses"],
+    }
+
+
+def clear_labels():
+    _labels.clear()
+    _stats["hits"] = _stats["misses"] = 0
+
+
+class LabelSlot:
+    def __init__(self, family, size, bold=False, antialias=True):
+        self.family = family
+        self.size = size
+        self.bold = bold
+        self.antialias = antialias
+        self.renders = 0
+        self._key = None
+        self._surface = None
+
+    def render(self, text, color):
+        key = (text, tuple(color))
+        if key != self._key:
+            font = get_font(self.family, self.size, self.bold)
+            self._surface = font.render(text, self.antialias, color)
+            self._key = key
+            self.renders += 1
+        return self._surface
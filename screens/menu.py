@@ -12,17 +12,12 @@ import pygame
 
 from game.config import (
     DISPLAY_WIDTH, DISPLAY_HEIGHT, 
-    BLACK, WHITE, GREEN, RED, BLUE, YELLOW,
+    WHITE, GREEN, RED, BLUE, YELLOW,
     DIFFICULTY_MODES, __version__
 )
-
-
-def draw_panel(surface, width, height, x, y, alpha=160, border_color=(120, 120, 120)):
-    panel = pygame.Surface((width, height))
-    panel.set_alpha(alpha)
-    panel.fill(BLACK)
-    pygame.draw.rect(panel, border_color, (0, 0, width, height), 3)
-    surface.blit(panel, (x, y))
+from screens.fonts import get_font
+from screens.labels import render_label
+from screens.panels import draw_panel, draw_box
 
 
 def display_main_menu(surface, game_state):
@@ -39,20 +34,20 @@ def display_main_menu(surface, game_state):
     panel_width, panel_height = 650, 450
     panel_x = (DISPLAY_WIDTH - panel_width) // 2
     panel_y = 60
-    draw_panel(surface, panel_width, panel_height, panel_x, panel_y)
+    draw_panel(surface, panel_width, panel_height, panel_x, panel_y, border_color=(120, 120, 120))
     
     # Title
-    font_title = pygame.font.SysFont("impact", 60)
-    title = font_title.render("SPEEDY HIGHWAY", True, WHITE)
+    font_title = get_font("impact", 60)
+    title = render_label(font_title, "SPEEDY HIGHWAY", WHITE)
     surface.blit(title, (center_x - title.get_width() // 2, 80))
     
     # Version
-    font_version = pygame.font.SysFont("bahnschrift", 18, True)
-    version_text = font_version.render(f"v{__version__} - Enhanced Edition", True, YELLOW)
+    font_version = get_font("bahnschrift", 18, True)
+    version_text = render_label(font_version, f"v{__version__} - Enhanced Edition", YELLOW)
     surface.blit(version_text, (center_x - version_text.get_width() // 2, 145))
     
     # Menu options
-    font_menu = pygame.font.SysFont("bahnschrift", 28, True)
+    font_menu = get_font("bahnschrift", 28, True)
     fullscreen_status = "ON" if game_state.fullscreen_mode else "OFF"
     options = [
         "SPACE - Start Game",
@@ -72,32 +67,29 @@ def display_main_menu(surface, game_state):
         else:
             color = WHITE
 
-        text = font_menu.render(option, True, color)
+        text = render_label(font_menu, option, color)
         surface.blit(text, (center_x - text.get_width() // 2, 200 + i * 35))
     
     # Volume info
-    font_small = pygame.font.SysFont("bahnschrift", 18)
+    font_small = get_font("bahnschrift", 18)
     volume_percent = int(game_state.sound_manager.master_volume * 100)
     volume_text = f"Sound Volume: {volume_percent}% (+/- to adjust, M to mute)"
-    volume_render = font_small.render(volume_text, True, YELLOW)
+    volume_render = render_label(font_small, volume_text, YELLOW)
     surface.blit(volume_render, (center_x - volume_render.get_width() // 2, 435))
     
     music_volume_percent = int(game_state.sound_manager.music_volume * 100)
     music_text = f"Music Volume: {music_volume_percent}% ([/] to adjust, N to mute)"
-    music_render = font_small.render(music_text, True, YELLOW)
+    music_render = render_label(font_small, music_text, YELLOW)
     surface.blit(music_render, (center_x - music_render.get_width() // 2, 455))
     
     fullscreen_text = "ALT+ENTER - Toggle fullscreen anytime"
-    fullscreen_render = font_small.render(fullscreen_text, True, GREEN)
+    fullscreen_render = render_label(font_small, fullscreen_text, GREEN)
     surface.blit(fullscreen_render, (center_x - fullscreen_render.get_width() // 2, 475))
 
     # Seed info
     seed_text = f"Entropy Seed: {game_state._entropy_seed} (S to set custom seed)"
-    seed_render = font_small.render(seed_text, True, BLUE)
-    seed_bg = pygame.Surface((seed_render.get_width() + 10, seed_render.get_height() + 4))
-    seed_bg.set_alpha(180)
-    seed_bg.fill(BLACK)
-    surface.blit(seed_bg, (5, 8))
+    seed_render = render_label(font_small, seed_text, BLUE)
+    draw_box(surface, seed_render.get_width() + 10, seed_render.get_height() + 4, 5, 8)
     surface.blit(seed_render, (10, 10))
     
     # Daily challenge
@@ -105,11 +97,8 @@ def display_main_menu(surface, game_state):
         challenge_text = f"Daily Challenge: {game_state.daily_challenge.get('description', 'N/A')}"
         if game_state.daily_challenge.get('completed', False):
             challenge_text += " [COMPLETE]"
-        text = font_small.render(challenge_text, True, YELLOW)
-        challenge_bg = pygame.Surface((text.get_width() + 10, text.get_height() + 4))
-        challenge_bg.set_alpha(180)
-        challenge_bg.fill(BLACK)
-        surface.blit(challenge_bg, (5, 548))
+        text = render_label(font_small, challenge_text, YELLOW)
+        draw_box(surface, text.get_width() + 10, text.get_height() + 4, 5, 548)
         surface.blit(text, (10, 550))
 
 
@@ -127,26 +116,27 @@ def display_seed_input(surface, game_state):
     panel_width, panel_height = 550, 400
     panel_x = (DISPLAY_WIDTH - panel_width) // 2
     panel_y = (DISPLAY_HEIGHT - panel_height) // 2
-    draw_panel(surface, panel_width, panel_height, panel_x, panel_y, alpha=180)
+    draw_panel(surface, panel_width, panel_height, panel_x, panel_y,
+               alpha=180, border_color=(120, 120, 120))
     
     # Fonts (consistent typography)
-    font_title = pygame.font.SysFont("impact", 48)
-    font_text = pygame.font.SysFont("bahnschrift", 24, True)
-    font_small = pygame.font.SysFont("bahnschrift", 18)
+    font_title = get_font("impact", 48)
+    font_text = get_font("bahnschrift", 24, True)
+    font_small = get_font("bahnschrift", 18)
     
     # Title
-    title = font_title.render("CUSTOM ENTROPY SEED", True, YELLOW)
+    title = render_label(font_title, "CUSTOM ENTROPY SEED", YELLOW)
     surface.blit(title, (center_x - title.get_width() // 2, 150))
     
     # Instruction
-    instruction = font_text.render("Enter a custom seed (integer):", True, WHITE)
+    instruction = render_label(font_text, "Enter a custom seed (integer):", WHITE)
     surface.blit(instruction, (center_x - instruction.get_width() // 2, 250))
     
     # Input box
     input_box_rect = pygame.Rect(300, 300, 200, 40)
     pygame.draw.rect(surface, WHITE, input_box_rect, 2)
     
-    input_text = font_text.render(game_state.seed_input_text, True, WHITE)
+    input_text = render_label(font_text, game_state.seed_input_text, WHITE)
     text_x = input_box_rect.x + 5
     text_y = input_box_rect.y + (input_box_rect.height - input_text.get_height()) // 2
     surface.blit(input_text, (text_x, text_y))
@@ -169,7 +159,7 @@ def display_seed_input(surface, game_state):
     
     for i, instr in enumerate(instructions):
         if instr:
-            text = font_small.render(instr, True, YELLOW)
+            text = render_label(font_small, instr, YELLOW)
             surface.blit(text, (center_x - text.get_width() // 2, 400 + i * 25))
 
 
@@ -191,19 +181,19 @@ def display_quit_confirmation(surface, game_state):
                alpha=200, border_color=(128, 128, 128))
     
     # Fonts
-    font_title = pygame.font.SysFont("impact", 48)
-    font_text = pygame.font.SysFont("bahnschrift", 24, True)
-    font_small = pygame.font.SysFont("bahnschrift", 18)
+    font_title = get_font("impact", 48)
+    font_text = get_font("bahnschrift", 24, True)
+    font_small = get_font("bahnschrift", 18)
     
     # Title
-    title = font_title.render("QUIT GAME?", True, RED)
+    title = render_label(font_title, "QUIT GAME?", RED)
     surface.blit(title, (center_x - title.get_width() // 2, 200))
     
     # Message
-    message = font_text.render("Are you sure you want to quit?", True, WHITE)
+    message = render_label(font_text, "Are you sure you want to quit?", WHITE)
     surface.blit(message, (center_x - message.get_width() // 2, 280))
     
-    warning = font_small.render("Any unsaved progress will be lost.", True, YELLOW)
+    warning = render_label(font_small, "Any unsaved progress will be lost.", YELLOW)
     surface.blit(warning, (center_x - warning.get_width() // 2, 320))
     
     # Options
@@ -215,5 +205,5 @@ def display_quit_confirmation(surface, game_state):
     
     for i, instruction in enumerate(instructions):
         color = GREEN if instruction.startswith("N") else YELLOW
-        text = font_small.render(instruction, True, color)
+        text = render_label(font_small, instruction, color)
         surface.blit(text, (center_x - text.get_width() // 2, 350 + i * 25))
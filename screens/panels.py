@@ -0,0 +1,51 @@
+"""
+Panel And Overlay Surfaces
+SpeedyHighway v1.2.0
+
+Builds translucent panels and overlays once and reuses them every frame.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from game.config import DISPLAY_WIDTH, DISPLAY_HEIGHT, BLACK
+
+
+_surfaces = {}
+
+
+def get_panel(width, height, alpha=160, fill=BLACK, border_color=(64, 64, 64), border_width=3):
+    key = (width, height, alpha, tuple(fill), border_color and tuple(border_color), border_width)
+    panel = _surfaces.get(key)
+    if panel is None:
+        panel = pygame.Surface((width, height))
+        panel.set_alpha(alpha)
+        panel.fill(fill)
+        if border_color and border_width:
+            pygame.draw.rect(panel, border_color, (0, 0, width, height), border_width)
+        _surfaces[key] = panel
+    return panel
+
+
+def get_overlay(alpha, fill=BLACK):
+    return get_panel(DISPLAY_WIDTH, DISPLAY_HEIGHT, alpha, fill, border_color=None, border_width=0)
+
+
+def draw_panel(surface, width, height, x, y, alpha=160, border_color=(64, 64, 64)):
+    surface.blit(get_panel(width, height, alpha, border_color=border_color), (x, y))
+
+
+def draw_box(surface, width, height, x, y, alpha=180, fill=BLACK):
+    surface.blit(get_panel(width, height, alpha, fill, border_color=None, border_width=0), (x, y))
+
+
+def panel_count():
+    return len(_surfaces)
+
+
+def clear_panels():
+    _surfaces.clear()
@@ -0,0 +1,72 @@
+"""
+Audio Cache Benchmark
+SpeedyHighway v1.2.0
+
+Times loading every sound effect from its WAV against loading it from the PCM cache.
+
+Usage: python tools/audio_cache_benchmark.py [--rounds N]
+"""
+
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from game.config import SOUND_FILES
+from game.utils import get_resource_path
+from managers.audio_cache import AudioCache
+
+
+def sound_paths():
+    paths = [get_resource_path(os.path.join("assets", "sounds", f)) for f in SOUND_FILES.values()]
+    return [p for p in paths if os.path.exists(p)]
+
+
+def time_loads(load, paths, rounds):
+    best = None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for path in paths:
+            load(path)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare WAV decoding with the PCM audio cache")
+    parser.add_argument("--rounds", type=int, default=5, help="best of N timings")
+    args = parser.parse_args()
+
+    pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+    print(f"mixer {pygame.mixer.get_init()}")
+    paths = sound_paths()
+    directory = tempfile.mkdtemp(prefix="speedyhighway-audio-")
+    try:
+        cache = AudioCache(directory)
+        start = time.perf_counter()
+        for path in paths:
+            cache.load(path)
+        first_run = time.perf_counter() - start
+
+        decode = time_loads(pygame.mixer.Sound, paths, args.rounds)
+        cached = time_loads(cache.load, paths, args.rounds)
+        size = sum(os.path.getsize(os.path.join(directory, f)) for f in os.listdir(directory))
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    print(f"{len(paths)} sounds, {size / 1e6:.1f} MB of cached PCM")
+    print(f"decode from WAV:     {decode * 1000:7.1f} ms")
+    print(f"load from cache:     {cached * 1000:7.1f} ms  ({decode / cached:.1f}x faster)")
+    print(f"first run (+write):  {first_run * 1000:7.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+"""
+Difficulty Balance Sweep
+SpeedyHighway v1.2.0
+
+Plays thousands of seeded runs headlessly across all cores and reports
+survival and score distributions per difficulty.
+
+Usage: python tools/balance_sweep.py [--seeds N] [--driver dodger|random] [--difficulty 0 1 ...]
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game.config import DIFFICULTY_MODES, LANE_POSITIONS, ENEMY_CAR_HEIGHT, SIMULATION_RATE
+from game.simulation import Simulation, INPUT_LEFT, INPUT_RIGHT
+
+MAX_TICKS = SIMULATION_RATE * 60 * 10
+
+
+class RandomDriver:
+    # Taps towards a random neighbouring lane now and then, never off the road
+
+    def __init__(self, seed, tap_chance=0.05):
+        self.random = random.Random(seed)
+        self.tap_chance = tap_chance
+        self._held = 0
+
+    def __call__(self, sim):
+        if self._held or self.random.random() >= self.tap_chance:
+            self._held = 0
+            return 0
+        lane = LANE_POSITIONS.index(sim.car_x)
+        moves = []
+        if lane > 0:
+            moves.append(INPUT_LEFT)
+        if lane < len(LANE_POSITIONS) - 1:
+            moves.append(INPUT_RIGHT)
+        self._held = self.random.choice(moves)
+        return self._held
+
+
+class DodgerDriver:
+    # Leaves its lane when a car is coming, for the nearest clear lane
+
+    def __init__(self, lookahead_ticks=30):
+        self.lookahead_ticks = lookahead_ticks
+        self._held = 0
+
+    def __call__(self, sim):
+        if self._held:
+            self._held = 0
+            return 0
+        horizon = sim.car_y - sim.enemy_speed * self.lookahead_ticks
+        blocked = {x for _, x, y, _ in sim.traffic.slots()
+                   if horizon < y + ENEMY_CAR_HEIGHT and y < sim.car_y + 50}
+        if sim.car_x not in blocked:
+            return 0
+        lane = LANE_POSITIONS.index(sim.car_x)
+        clear = [i for i, x in enumerate(LANE_POSITIONS) if x not in blocked]
+        if not clear:
+            return 0
+        target = min(clear, key=lambda i: abs(i - lane))
+        self._held = INPUT_LEFT if target < lane else INPUT_RIGHT
+        return self._held
+
+
+# Each factory takes the game seed; only the random driver draws from it
+DRIVERS = {"random": RandomDriver, "dodger": lambda seed: DodgerDriver()}
+
+
+def play(seed, difficulty, driver, max_ticks=MAX_TICKS):
+    sim = Simulation(seed, difficulty)
+    drive = DRIVERS[driver](seed)
+    while not sim.crashed and sim.count < max_ticks:
+        sim.step(drive(sim))
+    return sim.survival_time, sim.total_score, sim.near_miss_count, sim.crash_reason
+
+
+def _play_batch(job):
+    difficulty, driver, seeds, max_ticks = job
+    return difficulty, [play(seed, difficulty, driver, max_ticks) for seed in seeds]
+
+
+def _jobs(difficulties, driver, seeds, max_ticks, batch):
+    for difficulty in difficulties:
+        for start in range(0, len(seeds), batch):
+            yield difficulty, driver, seeds[start:start + batch], max_ticks
+
+
+def _percentile(values, fraction):
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def summarize(runs):
+    survival = sorted(r[0] / SIMULATION_RATE for r in runs)
+    scores = sorted(r[1] for r in runs)
+    reasons = {}
+    for r in runs:
+        reason = r[3] or "timeout"
+        reasons[reason] = reasons.get(reason, 0) + 1
+    return {
+        "runs": len(runs),
+        "survival": [_percentile(survival, p) for p in (0.1, 0.5, 0.9)] + [statistics.fmean(survival)],
+        "score": [_percentile(scores, p) for p in (0.1, 0.5, 0.9)] + [statistics.fmean(scores)],
+        "near_misses": statistics.fmean(r[2] for r in runs),
+        "reasons": reasons,
+    }
+
+
+def sweep(difficulties, driver="dodger", seeds=1000, first_seed=0, max_ticks=MAX_TICKS,
+          workers=None, batch=25):
+    seed_list = list(range(first_seed, first_seed + seeds))
+    results = {difficulty: [] for difficulty in difficulties}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for difficulty, runs in pool.map(_play_batch, _jobs(difficulties, driver, seed_list, max_ticks, batch)):
+            results[difficulty].extend(runs)
+    return {difficulty: summarize(runs) for difficulty, runs in results.items()}
+
+
+def print_report(report):
+    print(f"{'difficulty':<10} {'runs':>6} | {'survival s p10/p50/p90':>24} {'mean':>7} | "
+          f"{'score p10/p50/p90':>22} {'mean':>8} | {'misses':>6}  endings")
+    for difficulty, row in report.items():
+        survival = "/".join(f"{v:.1f}" for v in row["survival"][:3])
+        score = "/".join(str(v) for v in row["score"][:3])
+        endings = ", ".join(f"{k} {v}" for k, v in sorted(row["reasons"].items()))
+        print(f"{DIFFICULTY_MODES[difficulty]:<10} {row['runs']:>6} | {survival:>24} {row['survival'][3]:>7.1f} | "
+              f"{score:>22} {row['score'][3]:>8.0f} | {row['near_misses']:>6.1f}  {endings}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sweep seeds headlessly to balance difficulty settings")
+    parser.add_argument("--seeds", type=int, default=1000, help="runs per difficulty")
+    parser.add_argument("--first-seed", type=int, default=0)
+    parser.add_argument("--difficulty", type=int, nargs="+", default=list(range(len(DIFFICULTY_MODES))),
+                        choices=range(len(DIFFICULTY_MODES)))
+    parser.add_argument("--driver", choices=sorted(DRIVERS), default="dodger")
+    parser.add_argument("--max-ticks", type=int, default=MAX_TICKS, help="cap on a single run")
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: all cores)")
+    parser.add_argument("--batch", type=int, default=25, help="seeds per task")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    report = sweep(args.difficulty, args.driver, args.seeds, args.first_seed, args.max_ticks,
+                   args.workers, args.batch)
+    print_report(report)
+    runs = sum(row["runs"] for row in report.values())
+    print(f"\n{runs} runs with the {args.driver} driver in {time.perf_counter() - start:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,62 @@
+"""
+Environment Throughput Benchmark
+SpeedyHighway v1.2.0
+
+Measures agent environment steps per second on one core.
+
+Usage: python tools/env_benchmark.py [--steps N] [--envs 1 16 256]
+"""
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from game.env import HighwayEnv, VectorHighwayEnv, NUM_ACTIONS
+
+
+def bench_single(steps, difficulty, seed):
+    env = HighwayEnv(difficulty)
+    actions = np.random.default_rng(seed).integers(0, NUM_ACTIONS, steps)
+    env.reset(seed)
+    start = time.perf_counter()
+    for action in actions:
+        _, _, done, _ = env.step(action)
+        if done:
+            env.reset()
+    return steps / (time.perf_counter() - start)
+
+
+def bench_vector(num_envs, steps, difficulty, seed):
+    env = VectorHighwayEnv(num_envs, difficulty)
+    rng = np.random.default_rng(seed)
+    env.reset(seed)
+    calls = max(1, steps // num_envs)
+    actions = rng.integers(0, NUM_ACTIONS, (calls, num_envs))
+    start = time.perf_counter()
+    for batch in actions:
+        env.step(batch)
+    return calls * num_envs / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure agent environment throughput")
+    parser.add_argument("--steps", type=int, default=200000)
+    parser.add_argument("--envs", type=int, nargs="+", default=[1, 16, 256])
+    parser.add_argument("--difficulty", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"HighwayEnv: {bench_single(args.steps, args.difficulty, args.seed):,.0f} steps/s")
+    for num_envs in args.envs:
+        rate = bench_vector(num_envs, args.steps, args.difficulty, args.seed)
+        print(f"VectorHighwayEnv x{num_envs}: {rate:,.0f} steps/s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
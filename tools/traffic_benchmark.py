@@ -0,0 +1,95 @@
+"""
+Traffic Engine Benchmark
+SpeedyHighway v1.2.0
+
+Checks the NumPy traffic engine against the object engine and times both.
+
+Usage: python tools/traffic_benchmark.py [--ticks N] [--cars 10 100 1000]
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game.config import DISPLAY_HEIGHT, ENEMY_CAR_HEIGHT, LANE_POSITIONS
+from game.traffic import TrafficManager
+from game.traffic_numpy import ArrayTraffic
+from game.collision import player_hitboxes, enemy_hitbox
+
+SPEED = 8
+PLAYER_Y = int(DISPLAY_HEIGHT * 0.8)
+PLAYER = player_hitboxes(0)[0]
+ENEMY = enemy_hitbox()
+
+
+def build(engine, cars, seed):
+    # Spacing 0 refills the pool as soon as cars leave, so the road stays at N cars
+    traffic = engine(1, random.Random(seed).choice, pool_size=cars,
+                     spawn_spacing=0, density=lambda tick: cars)
+    traffic.clear()
+    span = DISPLAY_HEIGHT + ENEMY_CAR_HEIGHT
+    for i in range(cars):
+        traffic.spawn(DISPLAY_HEIGHT - (i * span) // cars)
+    return traffic
+
+
+def player_x(tick):
+    return LANE_POSITIONS[(tick // 30) % len(LANE_POSITIONS)]
+
+
+def run(traffic, ticks):
+    collisions = misses = 0
+    for tick in range(ticks):
+        traffic.update(SPEED, tick)
+        car_x = player_x(tick)
+        collisions += traffic.check_collision(car_x, PLAYER_Y, PLAYER, ENEMY) is not None
+        misses += traffic.check_near_miss(car_x, PLAYER_Y)
+    return collisions, misses
+
+
+def verify(cars, ticks, seed):
+    objects, arrays = build(TrafficManager, cars, seed), build(ArrayTraffic, cars, seed)
+    for tick in range(ticks):
+        objects.update(SPEED, tick)
+        arrays.update(SPEED, tick)
+        car_x = player_x(tick)
+        results = [(t.check_collision(car_x, PLAYER_Y, PLAYER, ENEMY), t.check_near_miss(car_x, PLAYER_Y),
+                    sorted((x, y) for _, x, y, _ in t.slots())) for t in (objects, arrays)]
+        if results[0] != results[1]:
+            return tick
+    return None
+
+
+def timed(engine, cars, ticks, seed):
+    traffic = build(engine, cars, seed)
+    start = time.perf_counter()
+    totals = run(traffic, ticks)
+    return time.perf_counter() - start, totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the object and NumPy traffic engines")
+    parser.add_argument("--ticks", type=int, default=2000)
+    parser.add_argument("--cars", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'cars':>6} {'objects us/tick':>16} {'numpy us/tick':>14} {'speedup':>8}  collisions/near misses")
+    for cars in args.cars:
+        mismatch = verify(cars, args.ticks, args.seed)
+        if mismatch is not None:
+            print(f"{cars:>6} engines disagree at tick {mismatch}")
+            return 1
+        object_time, totals = timed(TrafficManager, cars, args.ticks, args.seed)
+        array_time, _ = timed(ArrayTraffic, cars, args.ticks, args.seed)
+        print(f"{cars:>6} {object_time / args.ticks * 1e6:>16.1f} {array_time / args.ticks * 1e6:>14.1f} "
+              f"{object_time / array_time:>7.2f}x  {totals[0]}/{totals[1]}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())